@@ -1,15 +1,22 @@
-"""AI integration modules for AutoPaper."""
+"""AI integration modules for AutoPaper.
 
-from autopaper.ai import compose_issue
-from autopaper.ai import extract_article_metadata
-from autopaper.ai import generate_infocard
-from autopaper.ai import normalize_tags
-from autopaper.ai import generate_summary_card
+Submodules are imported on first attribute access (PEP 562) so that CLI
+commands which never talk to Claude don't pay for importing the SDK.
+"""
+import importlib
 
 __all__ = [
+    "batch_infocard",
     "compose_issue",
     "extract_article_metadata",
     "generate_infocard",
     "normalize_tags",
+    "parallel",
     "generate_summary_card",
 ]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,31 @@
+"""Shared Anthropic client for AI modules."""
+from functools import lru_cache
+
+import httpx
+from anthropic import Anthropic
+
+
+@lru_cache(maxsize=4)
+def get_client(api_key: str, base_url: str = "") -> Anthropic:
+    """Get a long-lived Anthropic client for the given credentials.
+
+    The client (and its connection pool) is reused across calls so repeated
+    requests skip the TCP/TLS handshake.
+
+    Args:
+        api_key: Anthropic API key
+        base_url: Optional custom base URL (for proxy/custom endpoint)
+
+    Returns:
+        Anthropic client instance
+    """
+    client_kwargs = {
+        "api_key": api_key,
+        "max_retries": 2,
+        "timeout": httpx.Timeout(600.0, connect=5.0),
+        "http_client": httpx.Client(limits=httpx.Limits(max_keepalive_connections=16)),
+    }
+    if base_url:
+        client_kwargs["base_url"] = base_url
+
+    return Anthropic(**client_kwargs)
@@ -0,0 +1,77 @@
+"""Generate multiple AI-style SVG cards via the Anthropic Message Batches API."""
+import time
+from typing import Any, Dict, List, Optional
+
+from autopaper.ai._client import get_client
+from autopaper.ai.generate_infocard import build_infocard_params, extract_svg
+from autopaper.config import config
+from autopaper.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds between batch status checks
+POLL_INTERVAL = 20
+
+
+def generate_infocards_batch(
+    requests: List[Dict[str, Any]], poll_interval: float = POLL_INTERVAL
+) -> List[Optional[str]]:
+    """Generate several cards in one asynchronous batch (billed at batch pricing).
+
+    Args:
+        requests: List of dicts with ``content``, ``title`` and optional ``style``
+            and ``key_points`` keys (same meaning as in ``generate_infocard``)
+        poll_interval: Seconds to wait between batch status checks
+
+    Returns:
+        List of SVG code strings in the same order as ``requests``;
+        ``None`` for items that failed
+    """
+    if not requests:
+        return []
+
+    # Get API key from config (supports both ANTHROPIC_API_KEY and ANTHROPIC_AUTH_TOKEN)
+    api_key = config.get_anthropic_api_key()
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY or ANTHROPIC_AUTH_TOKEN environment variable not set")
+
+    # Get optional custom base URL from config (for proxy/custom endpoint)
+    base_url = config.get_anthropic_base_url()
+    # Get model from config (supports ANTHROPIC_MODEL, ANTHROPIC_DEFAULT_SONNET_MODEL, or default)
+    model = config.get_anthropic_model() or config.get_anthropic_sonnet_model() or config.get_model()
+
+    client = get_client(api_key, base_url)
+
+    # custom_id must be ASCII, so index-based ids are used and mapped back afterwards
+    batch_requests = []
+    for index, item in enumerate(requests):
+        params = build_infocard_params(
+            content=item.get("content", ""),
+            title=item["title"],
+            style=item.get("style", "tech"),
+            key_points=item.get("key_points"),
+            model=model,
+        )
+        batch_requests.append({"custom_id": f"card-{index}", "params": params})
+
+    try:
+        batch = client.messages.batches.create(requests=batch_requests)
+        logger.info(f"Submitted infocard batch {batch.id} ({len(batch_requests)} requests)")
+
+        while batch.processing_status != "ended":
+            time.sleep(poll_interval)
+            batch = client.messages.batches.retrieve(batch.id)
+            logger.debug(f"Batch {batch.id} status: {batch.processing_status}")
+
+        results: List[Optional[str]] = [None] * len(requests)
+        for entry in client.messages.batches.results(batch.id):
+            index = int(entry.custom_id.split("-", 1)[1])
+            if entry.result.type == "succeeded":
+                results[index] = extract_svg(entry.result.message.content[0].text)
+            else:
+                logger.warning(f"Batch request {entry.custom_id} {entry.result.type}")
+
+        return results
+
+    except Exception as e:
+        raise RuntimeError(f"Failed to generate AI cards in batch: {e}")
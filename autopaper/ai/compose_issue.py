@@ -1,14 +1,9 @@
 """Skill: Compose issue from articles using Claude AI."""
 import json
-import os
-import sys
 from datetime import datetime
 from typing import Any, Dict, List
 
-from anthropic import Anthropic
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from autopaper.ai._client import get_client
 from autopaper.config import config
 from autopaper.utils.json_parser import parse_ai_json_response
 
@@ -44,11 +39,7 @@ def compose_issue(
     # Get model from config (supports ANTHROPIC_MODEL, ANTHROPIC_DEFAULT_SONNET_MODEL, or default)
     model = config.get_anthropic_model() or config.get_anthropic_sonnet_model() or config.get_model()
 
-    client_kwargs = {"api_key": api_key}
-    if base_url:
-        client_kwargs["base_url"] = base_url
-
-    client = Anthropic(**client_kwargs)
+    client = get_client(api_key, base_url)
 
     # Format articles for the prompt
     articles_text = json.dumps(
@@ -1,15 +1,12 @@
 """Skill: Extract article metadata using Claude AI."""
 import hashlib
-import os
 import sys
 from datetime import datetime
 from typing import Any, Dict
 
-from anthropic import Anthropic
 from anthropic import APIError, APITimeoutError
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from autopaper.ai._client import get_client
 from autopaper.config import config
 from autopaper.utils.json_parser import parse_ai_json_response
 from autopaper.utils.cache import CacheService, generate_cache_key
@@ -78,11 +75,7 @@ def extract_article_metadata(url: str, content: str, pre_extracted_title: str =
     # Get model from config (supports ANTHROPIC_MODEL, ANTHROPIC_DEFAULT_SONNET_MODEL, or default)
     model = config.get_anthropic_model() or config.get_anthropic_sonnet_model() or config.get_model()
 
-    client_kwargs = {"api_key": api_key}
-    if base_url:
-        client_kwargs["base_url"] = base_url
-
-    client = Anthropic(**client_kwargs)
+    client = get_client(api_key, base_url)
 
     # Determine content length - use more for WeChat articles as they have verbose HTML
     content_length = 20000 if is_wechat else 8000
@@ -181,7 +174,6 @@ IMPORTANT:
 if __name__ == "__main__":
     # Test the skill
     import json
-    import sys
 
     if len(sys.argv) < 2:
         print("Usage: python extract_article_metadata.py <url> [content_file]")
@@ -1,90 +1,136 @@
 """Generate AI-style SVG card for weekly summary."""
-import os
-import sys
+import hashlib
+import re
 from pathlib import Path
-from typing import Dict
+from typing import Any, Callable, Dict, List, Optional
 
-from anthropic import Anthropic
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from autopaper.ai._client import get_client
 from autopaper.config import config
+from autopaper.utils.cache import CacheService, generate_cache_key
+from autopaper.utils.logging import get_logger
 
+# Initialize cache and logger
+cache = CacheService(cache_dir="cache/infocards")
+logger = get_logger(__name__)
 
-def generate_infocard(
-    content: str,
-    title: str,
-    style: str = "tech",
-    key_points: list = None,
-) -> str:
-    """Generate an AI-style SVG card for technical content summary.
+# Used to minify the reference SVG template before embedding it in the prompt
+_XML_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+_WHITESPACE_RE = re.compile(r"\s+")
+_TAG_GAP_RE = re.compile(r">\s+<")
+
+
+def _minify_svg(svg: str) -> str:
+    """Strip comments and collapse whitespace in SVG markup.
 
     Args:
-        content: Weekly issue content or summary
-        title: Card title (e.g., "本周技术精选 · 2026-W04")
-        style: Card style ("tech" or "news")
-        key_points: List of key points to highlight
+        svg: SVG source
 
     Returns:
-        SVG code as string
+        Minified SVG on a single line
     """
-    # Get API key from config (supports both ANTHROPIC_API_KEY and ANTHROPIC_AUTH_TOKEN)
-    api_key = config.get_anthropic_api_key()
-    if not api_key:
-        raise ValueError("ANTHROPIC_API_KEY or ANTHROPIC_AUTH_TOKEN environment variable not set")
+    svg = _XML_COMMENT_RE.sub("", svg)
+    svg = _WHITESPACE_RE.sub(" ", svg)
+    return _TAG_GAP_RE.sub("><", svg).strip()
+
+
+def _build_svg_template(
+    bg_main: str,
+    bg_card: str,
+    primary_color: str,
+    secondary_color: str,
+    text_primary: str,
+    text_secondary: str,
+) -> str:
+    """Build the reference SVG layout embedded in the card prompt.
 
-    # Get optional custom base URL from config (for proxy/custom endpoint)
-    base_url = config.get_anthropic_base_url()
-    # Get model from config (supports ANTHROPIC_MODEL, ANTHROPIC_DEFAULT_SONNET_MODEL, or default)
-    model = config.get_anthropic_model() or config.get_anthropic_sonnet_model() or config.get_model()
+    Returns:
+        SVG template code
+    """
+    return f"""<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1200 675" width="1200" height="675">
+  <!-- 定义渐变和图案 -->
+  <defs>
+    <linearGradient id="bgGradient" x1="0%" y1="0%" x2="100%" y2="100%">
+      <stop offset="0%" style="stop-color:{bg_main};stop-opacity:1" />
+      <stop offset="100%" style="stop-color:#1A202C;stop-opacity:1" />
+    </linearGradient>
+    <linearGradient id="accentGradient" x1="0%" y1="0%" x2="100%" y2="0%">
+      <stop offset="0%" style="stop-color:{primary_color};stop-opacity:1" />
+      <stop offset="100%" style="stop-color:{secondary_color};stop-opacity:1" />
+    </linearGradient>
+    <pattern id="grid" width="40" height="40" patternUnits="userSpaceOnUse">
+      <path d="M 40 0 L 0 0 0 40" fill="none" stroke="{primary_color}" stroke-width="0.5" opacity="0.1"/>
+    </pattern>
+    <filter id="glow">
+      <feGaussianBlur stdDeviation="3" result="coloredBlur"/>
+      <feMerge>
+        <feMergeNode in="coloredBlur"/>
+        <feMergeNode in="SourceGraphic"/>
+      </feMerge>
+    </filter>
+  </defs>
 
-    client_kwargs = {"api_key": api_key}
-    if base_url:
-        client_kwargs["base_url"] = base_url
-
-    client = Anthropic(**client_kwargs)
-
-    # Define color schemes
-    if style == "tech":
-        primary_color = "#0066CC"  # Tech blue
-        secondary_color = "#00A1E9"
-        bg_main = "#0F1419"  # Dark background
-        bg_card = "#1A1F26"  # Card background
-        text_primary = "#FFFFFF"
-        text_secondary = "#A0AEC0"
-        accent_colors = ["#0066CC", "#00A1E9", "#4FD1C5"]
-    else:  # news
-        primary_color = "#10B981"  # Green
-        secondary_color = "#34D399"
-        bg_main = "#0F1419"
-        bg_card = "#1A1F26"
-        text_primary = "#FFFFFF"
-        text_secondary = "#A0AEC0"
-        accent_colors = ["#10B981", "#34D399", "#6EE7B7"]
+  <!-- 主背景 -->
+  <rect width="1200" height="675" fill="url(#bgGradient)"/>
+  <rect width="1200" height="675" fill="url(#grid)"/>
 
-    # Prepare key points text
-    key_points_text = ""
-    if key_points:
-        key_points_text = "\n".join([f"{i+1}. {point}" for i, point in enumerate(key_points[:4])])
-    else:
-        key_points_text = """1. AI编程工具从对话式向闭环式演进
-2. 自主Agent架构成为新趋势
-3. 云原生技术持续深化
-4. 开发者工具链无缝集成"""
+  <!-- 顶部装饰条 -->
+  <rect x="0" y="0" width="1200" height="4" fill="url(#accentGradient)"/>
 
-    prompt = f"""你是一个专业的技术内容设计师，擅长制作AI风格的技术信息图卡片。
+  <!-- 左侧区域: 标题和品牌 -->
+  <g transform="translate(60, 80)">
+    <!-- 标题卡片 -->
+    <rect x="0" y="0" width="420" height="200" rx="16" fill="{bg_card}" filter="url(#glow)"/>
+    <text x="30" y="55" font-family="system-ui, sans-serif" font-size="42" font-weight="bold" fill="{text_primary}">{{标题}}</text>
+    <text x="30" y="100" font-family="system-ui, sans-serif" font-size="22" fill="{text_secondary}">技术周刊 · 深度解读</text>
+    <rect x="30" y="130" width="80" height="4" rx="2" fill="{primary_color}"/>
+    <text x="30" y="165" font-family="system-ui, sans-serif" font-size="18" fill="{text_secondary}">Generated by AutoPaper</text>
+  </g>
 
-# 任务
-根据以下技术周刊内容，生成一张适合技术社交平台发布的精美SVG卡片代码。
+  <!-- 右侧区域: 核心要点 -->
+  <g transform="translate(540, 80)">
+    <rect x="0" y="0" width="600" height="500" rx="16" fill="{bg_card}" opacity="0.8"/>
+    <text x="40" y="55" font-family="system-ui, sans-serif" font-size="32" font-weight="bold" fill="{primary_color}">本周核心看点</text>
 
-# 输入信息
-**标题**: {title}
-**风格**: AI技术风格
-**核心要点**:
-{key_points_text}
+    <!-- 要点列表 - 从 y=120 开始，确保与标题有足够间距 -->
+    <g transform="translate(40, 120)">
+      <!-- 动态生成4个要点，每个要点间隔 50px -->
+    </g>
+  </g>
 
-**完整内容**:
-{content[:2000]}
+  <!-- 底部信息 -->
+  <text x="60" y="640" font-family="system-ui, sans-serif" font-size="14" fill="{text_secondary}">2026 Week 04</text>
+  <text x="1140" y="640" font-family="system-ui, sans-serif" font-size="14" fill="{text_secondary}" text-anchor="end">AI.style</text>
+</svg>
+"""
+
+
+def _build_static_prompt(
+    bg_main: str,
+    bg_card: str,
+    primary_color: str,
+    secondary_color: str,
+    text_primary: str,
+    text_secondary: str,
+    accent_colors: List[str],
+) -> str:
+    """Build the static part of the card prompt (design spec + SVG template).
+
+    The result only depends on the color scheme, so it stays byte-identical
+    across calls for the same style and can be served from Anthropic's prompt cache.
+
+    Returns:
+        System prompt text
+    """
+    svg_template = _minify_svg(
+        _build_svg_template(
+            bg_main, bg_card, primary_color, secondary_color, text_primary, text_secondary
+        )
+    )
+
+    return f"""你是一个专业的技术内容设计师，擅长制作AI风格的技术信息图卡片。
+
+# 任务
+根据用户提供的技术周刊内容，生成一张适合技术社交平台发布的精美SVG卡片代码。
 
 # 设计要求
 1. **尺寸**: 1200 x 675 (横屏，16:9，适合PC阅读)
@@ -137,71 +183,12 @@ def generate_infocard(
    ```
 
 8. **设计原则**:
-   - AI科技专业感
-   - 信息层次清晰
-   - 视觉重点突出
-   - 色彩对比明显
-   - 适合PC端阅读
-   - 可作为技术博客封面
+   - 信息层次清晰，色彩对比明显
    - **文字可读性优先**：确保右侧要点不拥挤，分行清晰
 
 # SVG模板结构
 ```xml
-<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1200 675" width="1200" height="675">
-  <!-- 定义渐变和图案 -->
-  <defs>
-    <linearGradient id="bgGradient" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:{bg_main};stop-opacity:1" />
-      <stop offset="100%" style="stop-color:#1A202C;stop-opacity:1" />
-    </linearGradient>
-    <linearGradient id="accentGradient" x1="0%" y1="0%" x2="100%" y2="0%">
-      <stop offset="0%" style="stop-color:{primary_color};stop-opacity:1" />
-      <stop offset="100%" style="stop-color:{secondary_color};stop-opacity:1" />
-    </linearGradient>
-    <pattern id="grid" width="40" height="40" patternUnits="userSpaceOnUse">
-      <path d="M 40 0 L 0 0 0 40" fill="none" stroke="{primary_color}" stroke-width="0.5" opacity="0.1"/>
-    </pattern>
-    <filter id="glow">
-      <feGaussianBlur stdDeviation="3" result="coloredBlur"/>
-      <feMerge>
-        <feMergeNode in="coloredBlur"/>
-        <feMergeNode in="SourceGraphic"/>
-      </feMerge>
-    </filter>
-  </defs>
-
-  <!-- 主背景 -->
-  <rect width="1200" height="675" fill="url(#bgGradient)"/>
-  <rect width="1200" height="675" fill="url(#grid)"/>
-
-  <!-- 顶部装饰条 -->
-  <rect x="0" y="0" width="1200" height="4" fill="url(#accentGradient)"/>
-
-  <!-- 左侧区域: 标题和品牌 -->
-  <g transform="translate(60, 80)">
-    <!-- 标题卡片 -->
-    <rect x="0" y="0" width="420" height="200" rx="16" fill="{bg_card}" filter="url(#glow)"/>
-    <text x="30" y="55" font-family="system-ui, sans-serif" font-size="42" font-weight="bold" fill="{text_primary}">{title}</text>
-    <text x="30" y="100" font-family="system-ui, sans-serif" font-size="22" fill="{text_secondary}">技术周刊 · 深度解读</text>
-    <rect x="30" y="130" width="80" height="4" rx="2" fill="{primary_color}"/>
-    <text x="30" y="165" font-family="system-ui, sans-serif" font-size="18" fill="{text_secondary}">Generated by AutoPaper</text>
-  </g>
-
-  <!-- 右侧区域: 核心要点 -->
-  <g transform="translate(540, 80)">
-    <rect x="0" y="0" width="600" height="500" rx="16" fill="{bg_card}" opacity="0.8"/>
-    <text x="40" y="55" font-family="system-ui, sans-serif" font-size="32" font-weight="bold" fill="{primary_color}">本周核心看点</text>
-
-    <!-- 要点列表 - 从 y=120 开始，确保与标题有足够间距 -->
-    <g transform="translate(40, 120)">
-      <!-- 动态生成4个要点，每个要点间隔 50px -->
-    </g>
-  </g>
-
-  <!-- 底部信息 -->
-  <text x="60" y="640" font-family="system-ui, sans-serif" font-size="14" fill="{text_secondary}">2026 Week 04</text>
-  <text x="1140" y="640" font-family="system-ui, sans-serif" font-size="14" fill="{text_secondary}" text-anchor="end">AI.style</text>
-</svg>
+{svg_template}
 ```
 
 # 要点列表样式
@@ -217,26 +204,177 @@ def generate_infocard(
 4. 确保中文字符正确显示（使用UTF-8编码）
 5. 横屏设计，视觉重心合理分布
 6. 信息层次清晰，一目了然
+"""
+
+
+# Color schemes per card style
+_STYLES = {
+    "tech": {
+        "primary_color": "#0066CC",  # Tech blue
+        "secondary_color": "#00A1E9",
+        "bg_main": "#0F1419",  # Dark background
+        "bg_card": "#1A1F26",  # Card background
+        "text_primary": "#FFFFFF",
+        "text_secondary": "#A0AEC0",
+        "accent_colors": ["#0066CC", "#00A1E9", "#4FD1C5"],
+    },
+    "news": {
+        "primary_color": "#10B981",  # Green
+        "secondary_color": "#34D399",
+        "bg_main": "#0F1419",
+        "bg_card": "#1A1F26",
+        "text_primary": "#FFFFFF",
+        "text_secondary": "#A0AEC0",
+        "accent_colors": ["#10B981", "#34D399", "#6EE7B7"],
+    },
+}
+
+# Static prompts are built once per style at import time
+_STATIC_PROMPTS = {style: _build_static_prompt(**colors) for style, colors in _STYLES.items()}
+
+# Matches a ```xml / ```svg / ``` fenced block (closing fence optional for truncated output)
+_FENCE_RE = re.compile(r"```(?:xml|svg)?\s*(.*?)(?:```|$)", re.DOTALL)
+
+# Only the per-card inputs go into the user message; the static prefix is cached
+_USER_PROMPT_TEMPLATE = """# 输入信息
+**标题**: {title}
+**风格**: AI技术风格
+**核心要点**:
+{key_points_text}
+
+**完整内容**:
+{content}
 
 请现在生成AI风格的SVG代码：
 """
 
+
+def build_infocard_params(
+    content: str,
+    title: str,
+    style: str = "tech",
+    key_points: list = None,
+    model: str = "",
+) -> Dict[str, Any]:
+    """Build Messages API parameters for a single card.
+
+    Shared by the interactive path and the batch path so both hit the same
+    cached static prompt prefix.
+
+    Args:
+        content: Weekly issue content or summary
+        title: Card title
+        style: Card style ("tech" or "news")
+        key_points: List of key points to highlight
+        model: Model name
+
+    Returns:
+        Keyword arguments for ``client.messages.create``
+    """
+    # Prepare key points text
+    key_points_text = ""
+    if key_points:
+        key_points_text = "\n".join([f"{i+1}. {point}" for i, point in enumerate(key_points[:4])])
+    else:
+        key_points_text = """1. AI编程工具从对话式向闭环式演进
+2. 自主Agent架构成为新趋势
+3. 云原生技术持续深化
+4. 开发者工具链无缝集成"""
+
+    static_prompt = _STATIC_PROMPTS.get(style, _STATIC_PROMPTS["news"])
+    prompt = _USER_PROMPT_TEMPLATE.format(
+        title=title, key_points_text=key_points_text, content=content[:2000]
+    )
+
+    return {
+        "model": model,
+        "max_tokens": 4096,
+        "system": [
+            {
+                "type": "text",
+                "text": static_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ],
+        "messages": [{"role": "user", "content": prompt}],
+    }
+
+
+def extract_svg(text: str) -> str:
+    """Extract SVG code from a model response.
+
+    Args:
+        text: Raw response text
+
+    Returns:
+        SVG code with any markdown code fences stripped
+    """
+    fence_match = _FENCE_RE.search(text)
+    return fence_match.group(1).strip() if fence_match else text.strip()
+
+
+def generate_infocard(
+    content: str,
+    title: str,
+    style: str = "tech",
+    key_points: list = None,
+    on_chunk: Optional[Callable[[str], None]] = None,
+    force: bool = False,
+) -> str:
+    """Generate an AI-style SVG card for technical content summary.
+
+    Args:
+        content: Weekly issue content or summary
+        title: Card title (e.g., "本周技术精选 · 2026-W04")
+        style: Card style ("tech" or "news")
+        key_points: List of key points to highlight
+        on_chunk: Optional callback invoked with each streamed text chunk (for progress display)
+        force: Force regeneration even if a cached SVG exists
+
+    Returns:
+        SVG code as string
+    """
+    # Get API key from config (supports both ANTHROPIC_API_KEY and ANTHROPIC_AUTH_TOKEN)
+    api_key = config.get_anthropic_api_key()
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY or ANTHROPIC_AUTH_TOKEN environment variable not set")
+
+    # Get optional custom base URL from config (for proxy/custom endpoint)
+    base_url = config.get_anthropic_base_url()
+    # Get model from config (supports ANTHROPIC_MODEL, ANTHROPIC_DEFAULT_SONNET_MODEL, or default)
+    model = config.get_anthropic_model() or config.get_anthropic_sonnet_model() or config.get_model()
+
+    client = get_client(api_key, base_url)
+
+    params = build_infocard_params(content, title, style, key_points, model)
+
+    # The user prompt already contains title, key points and truncated content
+    prompt_hash = hashlib.blake2b(
+        f"{style}\0{params['messages'][0]['content']}".encode(), digest_size=16
+    ).hexdigest()
+    cache_key = generate_cache_key("generate_infocard", prompt_hash)
+
+    if not force and (cached := cache.get(cache_key)):
+        logger.info(f"Using cached infocard for '{title}'")
+        return cached
+
     try:
-        response = client.messages.create(
-            model=model,
-            max_tokens=8192,
-            messages=[{"role": "user", "content": prompt}],
-        )
+        # Stream the response so callers can show progress while the SVG is decoded
+        chunks = []
+        with client.messages.stream(**params) as stream:
+            for text in stream.text_stream:
+                chunks.append(text)
+                if on_chunk:
+                    on_chunk(text)
+            response = stream.get_final_message()
+
+        cache_read = getattr(response.usage, "cache_read_input_tokens", None)
+        logger.debug(f"Infocard prompt cache read tokens: {cache_read}")
 
-        svg_code = response.content[0].text
+        svg_code = extract_svg("".join(chunks))
 
-        # Clean up response if needed
-        if "```xml" in svg_code:
-            svg_code = svg_code.split("```xml")[1].split("```")[0].strip()
-        elif "```svg" in svg_code:
-            svg_code = svg_code.split("```svg")[1].split("```")[0].strip()
-        elif "```" in svg_code:
-            svg_code = svg_code.split("```")[1].split("```")[0].strip()
+        # Cache the result (7 days TTL)
+        cache.set(cache_key, svg_code, ttl=604800)
 
         return svg_code
 
@@ -254,8 +392,7 @@ def save_infocard(svg_code: str, output_path: str):
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(svg_code)
+    output_file.write_bytes(svg_code.encode("utf-8"))
 
 
 if __name__ == "__main__":
@@ -1,16 +1,34 @@
 """Generate Xiaohongshu-style SVG card for weekly summary."""
-import os
-import sys
+import io
 from pathlib import Path
 from typing import Dict
 
-from anthropic import Anthropic
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from autopaper.ai._client import get_client
 from autopaper.config import config
 from autopaper.utils.web import fetch_url_content
 
+# Color schemes per card style
+_STYLES = {
+    "tech": {
+        "primary_color": "#2563eb",  # Blue
+        "secondary_color": "#3b82f6",
+        "bg_gradient_start": "#DBEAFE",
+        "bg_gradient_end": "#EFF6FF",
+        "card_bg": "#F8FAFC",
+        "accent_colors": ["#3B82F6", "#60A5FA", "#93C5FD"],
+        "accent_colors_text": "#3B82F6, #60A5FA, #93C5FD",
+    },
+    "news": {
+        "primary_color": "#10b981",  # Green
+        "secondary_color": "#34d399",
+        "bg_gradient_start": "#D1FAE5",
+        "bg_gradient_end": "#ECFDF5",
+        "card_bg": "#F0FDF4",
+        "accent_colors": ["#10B981", "#34D399", "#6EE7B7"],
+        "accent_colors_text": "#10B981, #34D399, #6EE7B7",
+    },
+}
+
 
 def generate_weekly_summary_card(
     content: str,
@@ -39,27 +57,9 @@ def generate_weekly_summary_card(
     # Get model from config (supports ANTHROPIC_MODEL, ANTHROPIC_DEFAULT_SONNET_MODEL, or default)
     model = config.get_anthropic_model() or config.get_anthropic_sonnet_model() or config.get_model()
 
-    client_kwargs = {"api_key": api_key}
-    if base_url:
-        client_kwargs["base_url"] = base_url
-
-    client = Anthropic(**client_kwargs)
-
-    # Define color schemes
-    if style == "tech":
-        primary_color = "#2563eb"  # Blue
-        secondary_color = "#3b82f6"
-        bg_gradient_start = "#DBEAFE"
-        bg_gradient_end = "#EFF6FF"
-        card_bg = "#F8FAFC"
-        accent_colors = ["#3B82F6", "#60A5FA", "#93C5FD"]
-    else:  # news
-        primary_color = "#10b981"  # Green
-        secondary_color = "#34d399"
-        bg_gradient_start = "#D1FAE5"
-        bg_gradient_end = "#ECFDF5"
-        card_bg = "#F0FDF4"
-        accent_colors = ["#10B981", "#34D399", "#6EE7B7"]
+    client = get_client(api_key, base_url)
+
+    colors = _STYLES.get(style, _STYLES["news"])
 
     # Prepare key points text
     key_points_text = ""
@@ -86,11 +86,11 @@ def generate_weekly_summary_card(
 1. **尺寸**: 750 x 1334 (竖屏，适合手机阅读)
 2. **风格**: 小红书风格 - 高颜值、有设计感、信息清晰
 3. **配色方案**:
-   - 主色: {primary_color}
-   - 辅助色: {secondary_color}
-   - 背景渐变: {bg_gradient_start} → {bg_gradient_end}
-   - 卡片背景: {card_bg}
-   - 强调色: {", ".join(accent_colors)}
+   - 主色: {colors['primary_color']}
+   - 辅助色: {colors['secondary_color']}
+   - 背景渐变: {colors['bg_gradient_start']} → {colors['bg_gradient_end']}
+   - 卡片背景: {colors['card_bg']}
+   - 强调色: {colors['accent_colors_text']}
 
 4. **视觉元素**:
    - 柔和的渐变背景
@@ -120,8 +120,8 @@ def generate_weekly_summary_card(
   <!-- 定义渐变和滤镜 -->
   <defs>
     <linearGradient id="bgGradient" x1="0%" y1="0%" x2="0%" y2="100%">
-      <stop offset="0%" style="stop-color:{bg_gradient_start};stop-opacity:1" />
-      <stop offset="100%" style="stop-color:{bg_gradient_end};stop-opacity:1" />
+      <stop offset="0%" style="stop-color:{colors['bg_gradient_start']};stop-opacity:1" />
+      <stop offset="100%" style="stop-color:{colors['bg_gradient_end']};stop-opacity:1" />
     </linearGradient>
     <filter id="shadow">
       <feGaussianBlur in="SourceAlpha" stdDeviation="4"/>
@@ -140,15 +140,15 @@ def generate_weekly_summary_card(
   <rect width="750" height="1334" fill="url(#bgGradient)"/>
 
   <!-- 装饰元素 -->
-  <circle cx="100" cy="100" r="80" fill="{accent_colors[0]}" opacity="0.3"/>
-  <circle cx="650" cy="200" r="120" fill="{accent_colors[1]}" opacity="0.2"/>
-  <circle cx="150" cy="1200" r="100" fill="{accent_colors[2]}" opacity="0.25"/>
+  <circle cx="100" cy="100" r="80" fill="{colors['accent_colors'][0]}" opacity="0.3"/>
+  <circle cx="650" cy="200" r="120" fill="{colors['accent_colors'][1]}" opacity="0.2"/>
+  <circle cx="150" cy="1200" r="100" fill="{colors['accent_colors'][2]}" opacity="0.25"/>
 
   <!-- 内容卡片区域 -->
   <g>
     <!-- 标题卡片 -->
     <rect x="50" y="80" width="650" height="150" rx="20" fill="white" filter="url(#shadow)"/>
-    <text x="375" y="160" font-family="system-ui, sans-serif" font-size="40" font-weight="bold" fill="{primary_color}" text-anchor="middle">{title}</text>
+    <text x="375" y="160" font-family="system-ui, sans-serif" font-size="40" font-weight="bold" fill="{colors['primary_color']}" text-anchor="middle">{title}</text>
 
     <!-- 核心要点卡片 -->
     <rect x="50" y="260" width="650" height="900" rx="20" fill="white" filter="url(#shadow)"/>
@@ -217,10 +217,10 @@ def generate_card_from_url(
 
     # Extract key points from content
     # This is a simple implementation - you can enhance it
-    lines = content.split("\n")
+    # Iterate lazily so we stop reading as soon as enough points are found
     key_points = []
 
-    for line in lines:
+    for line in io.StringIO(content):
         line = line.strip()
         # Look for bullet points or numbered lists
         if line.startswith(("•", "-", "*", "1.", "2.", "3.", "4.", "5.")):
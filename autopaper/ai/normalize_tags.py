@@ -1,13 +1,8 @@
 """Skill: Normalize tags using Claude AI."""
 import json
-import os
-import sys
 from typing import Dict, List
 
-from anthropic import Anthropic
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from autopaper.ai._client import get_client
 from autopaper.config import config
 
 
@@ -49,11 +44,7 @@ def normalize_tags(tags: List[str], custom_rules: Dict[str, List[str]] = None) -
     # Get model from config (supports ANTHROPIC_MODEL, ANTHROPIC_DEFAULT_HAIKU_MODEL, or default)
     model = config.get_anthropic_model() or config.get_anthropic_haiku_model() or "claude-haiku-4-20250514"
 
-    client_kwargs = {"api_key": api_key}
-    if base_url:
-        client_kwargs["base_url"] = base_url
-
-    client = Anthropic(**client_kwargs)
+    client = get_client(api_key, base_url)
 
     # Format rules for the prompt
     rules_text = json.dumps(rules, indent=2)
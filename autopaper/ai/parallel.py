@@ -0,0 +1,150 @@
+"""Concurrent, rate-limited execution of Claude requests."""
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from autopaper.ai import generate_infocard
+from autopaper.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class RateLimitedExecutor:
+    """Thread pool that throttles submissions with request and token buckets.
+
+    Defaults match Anthropic's tier-1 limits (40 requests/min, 16k input tokens/min).
+
+    Examples:
+        >>> with RateLimitedExecutor(rpm=40, tpm=16000) as executor:
+        >>>     future = executor.submit(call_claude, prompt, estimated_tokens=len(prompt) // 4)
+    """
+
+    def __init__(self, rpm: int = 40, tpm: int = 16000, max_workers: int = 8):
+        """Initialize executor.
+
+        Args:
+            rpm: Maximum requests per minute
+            tpm: Maximum input tokens per minute
+            max_workers: Maximum number of concurrent requests
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._lock = threading.Lock()
+        self._request_budget = float(rpm)
+        self._token_budget = float(tpm)
+        self._last_refill = time.monotonic()
+
+    def _refill(self):
+        """Refill both buckets according to elapsed time."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._request_budget = min(self.rpm, self._request_budget + elapsed * self.rpm / 60)
+        self._token_budget = min(self.tpm, self._token_budget + elapsed * self.tpm / 60)
+
+    def _acquire(self, tokens: int):
+        """Block until a request with the given token estimate may be sent.
+
+        Args:
+            tokens: Estimated input tokens of the request
+        """
+        # A request larger than the whole bucket would otherwise wait forever
+        tokens = min(tokens, self.tpm)
+
+        while True:
+            with self._lock:
+                self._refill()
+                if self._request_budget >= 1 and self._token_budget >= tokens:
+                    self._request_budget -= 1
+                    self._token_budget -= tokens
+                    return
+                wait = max(
+                    (1 - self._request_budget) * 60 / self.rpm,
+                    (tokens - self._token_budget) * 60 / self.tpm,
+                )
+            logger.debug(f"Rate limit reached, waiting {wait:.2f}s")
+            time.sleep(wait)
+
+    def submit(self, fn: Callable, *args: Any, estimated_tokens: int = 0, **kwargs: Any) -> Future:
+        """Submit a call once the rate limits allow it.
+
+        Args:
+            fn: Function to call
+            *args: Positional arguments for fn
+            estimated_tokens: Estimated input tokens used by the call
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Future for the call result
+        """
+        self._acquire(estimated_tokens)
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True):
+        """Shut down the underlying thread pool."""
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "RateLimitedExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown(wait=True)
+
+
+def _estimate_tokens(params: Dict[str, Any]) -> int:
+    """Roughly estimate input tokens of a request (~4 characters per token).
+
+    Args:
+        params: Messages API parameters
+
+    Returns:
+        Estimated token count
+    """
+    chars = sum(len(block["text"]) for block in params.get("system", []))
+    chars += sum(len(message["content"]) for message in params["messages"])
+    return chars // 4
+
+
+def generate_infocards_parallel(
+    items: List[Dict[str, Any]], rpm: int = 40, tpm: int = 16000, max_workers: int = 8
+) -> List[Optional[str]]:
+    """Generate several cards concurrently, respecting rate limits.
+
+    Args:
+        items: List of dicts with ``generate_infocard`` keyword arguments
+            (``content``, ``title``, optional ``style`` and ``key_points``)
+        rpm: Maximum requests per minute
+        tpm: Maximum input tokens per minute
+        max_workers: Maximum number of concurrent requests
+
+    Returns:
+        List of SVG code strings in the same order as ``items``;
+        ``None`` for items that failed
+    """
+    results: List[Optional[str]] = [None] * len(items)
+
+    with RateLimitedExecutor(rpm=rpm, tpm=tpm, max_workers=max_workers) as executor:
+        futures = {}
+        for index, item in enumerate(items):
+            params = generate_infocard.build_infocard_params(
+                content=item.get("content", ""),
+                title=item["title"],
+                style=item.get("style", "tech"),
+                key_points=item.get("key_points"),
+            )
+            future = executor.submit(
+                generate_infocard.generate_infocard,
+                estimated_tokens=_estimate_tokens(params),
+                **item,
+            )
+            futures[future] = index
+
+        for future, index in futures.items():
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                logger.warning(f"Failed to generate card '{items[index]['title']}': {e}")
+
+    return results
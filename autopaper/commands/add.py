@@ -1,17 +1,18 @@
 """Add article command."""
-import json
+import hashlib
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse
 
+import orjson
 import requests
 import typer
 from rich.console import Console
 
-from autopaper.ai import extract_article_metadata
 from autopaper.config import config
-from autopaper.database import Database
+from autopaper.database import get_db
 from autopaper.models import Article
 from autopaper.scrapers.article import ArticleScraper
 from autopaper.utils.slug import generate_unique_slug
@@ -22,6 +23,19 @@ from autopaper.utils.extract_date import extract_date_from_html
 console = Console()
 logger = get_logger(__name__)
 
+# Browser-like headers for image downloads (some CDNs block non-browser clients)
+_IMAGE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Referer": "https://www.google.com/",
+    "Sec-Fetch-Dest": "image",
+    "Sec-Fetch-Mode": "no-cors",
+    "Sec-Fetch-Site": "cross-site",
+}
+
 
 def download_image(url: str, output_dir: Path, slug: str, force: bool = False) -> str:
     """Download image from URL and save locally.
@@ -52,23 +66,16 @@ def download_image(url: str, output_dir: Path, slug: str, force: bool = False) -
 
         # Download image with enhanced headers for anti-crawling
         console.print(f"  [dim]⬇ Downloading image: {safe_filename}[/dim]")
-        response = requests.get(url, timeout=15, headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Referer": "https://www.google.com/",
-            "Sec-Fetch-Dest": "image",
-            "Sec-Fetch-Mode": "no-cors",
-            "Sec-Fetch-Site": "cross-site",
-        })
-        response.raise_for_status()
-
-        # Save to file
         output_dir.mkdir(parents=True, exist_ok=True)
-        with open(local_path, "wb") as f:
-            f.write(response.content)
+        partial_path = output_dir / f"{safe_filename}.part"
+        with requests.get(url, timeout=15, stream=True, headers=_IMAGE_HEADERS) as response:
+            response.raise_for_status()
+
+            # Stream to a temporary file so an interrupted download is never mistaken for a cached image
+            with open(partial_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    f.write(chunk)
+        partial_path.replace(local_path)
 
         console.print(f"  [green]✓ Image saved: {safe_filename}[/green]")
         return safe_filename
@@ -89,7 +96,13 @@ def add(
         url: Article URL to add
         force: Force re-download and re-extract (update existing article)
     """
-    db = Database(config.get_database_path())
+    from autopaper.ai import extract_article_metadata
+
+    added_date = datetime.now()
+    images_dir = Path(config.get_articles_images_dir())
+    enriched_dir = Path(config.get_articles_enriched_dir())
+
+    db = get_db()
 
     # Check if article already exists
     existing = db.get_article_by_url(url)
@@ -113,76 +126,77 @@ def add(
 
     console.print("[cyan]Extracting metadata using Claude...[/cyan]")
 
-    try:
+    cover_image_url = None
+    image_future = None
+
+    # The Claude call and the cover image download are independent, so run them concurrently.
+    # The slug isn't known until metadata arrives, so the image is staged under a URL-derived name.
+    with ThreadPoolExecutor(max_workers=2) as executor:
         # Extract metadata using Claude skill, passing pre-extracted title for better accuracy
-        metadata = extract_article_metadata.extract_article_metadata(
-            url, scraped["content"], pre_extracted_title=scraped["title"], force=force
+        metadata_future = executor.submit(
+            extract_article_metadata.extract_article_metadata,
+            url,
+            scraped["content"],
+            pre_extracted_title=scraped["title"],
+            force=force,
         )
-        logger.info(f"Successfully extracted metadata for {url}")
-    except Exception as e:
-        logger.warning(f"Failed to extract metadata from AI: {e}", exc_info=True)
-        console.print(f"[yellow]Warning: Failed to extract metadata: {e}[/yellow]")
-        console.print("[dim]Using basic extracted data...[/dim]")
-
-        # Fallback to basic extraction
-        metadata = {
-            "title": scraped["title"],
-            "author": "Unknown",
-            "source": urlparse(url).netloc,
-            "publish_date": datetime.now().strftime("%Y-%m-%d"),
-            "summary": scraped["short_excerpt"],
-            "tags": [],
-            "article_type": "news",
-            "key_points": [],
-        }
+
+        # Extract cover image URL from the HTML fetched during scraping
+        console.print("[cyan]Extracting cover image...[/cyan]")
+        html = scraped.get("html")
+        if not html:
+            # Parsed content was cached without a raw HTML copy
+            html = scraper.fetch_article(url)
+
+        if html:
+            cover_image_url = scraper.extract_cover_image_url(html, url)
+            if cover_image_url:
+                console.print(f"[green]✓[/green] Cover image URL found")
+
+                # Skip WeChat images — they block external hotlinking
+                wechat_hosts = ("mmbiz.qpic.cn", "mmbiz.qlogo.cn", "wx.qlogo.cn")
+                if any(h in cover_image_url for h in wechat_hosts):
+                    console.print(f"  [dim]⚠ Skipping WeChat image (hotlink blocked)[/dim]")
+                else:
+                    # Download image during add phase
+                    staging_name = f".pending-{hashlib.md5(url.encode()).hexdigest()}"
+                    image_future = executor.submit(
+                        download_image, cover_image_url, images_dir, staging_name, force=True
+                    )
+
+        try:
+            metadata = metadata_future.result()
+            logger.info(f"Successfully extracted metadata for {url}")
+        except Exception as e:
+            logger.warning(f"Failed to extract metadata from AI: {e}", exc_info=True)
+            console.print(f"[yellow]Warning: Failed to extract metadata: {e}[/yellow]")
+            console.print("[dim]Using basic extracted data...[/dim]")
+
+            # Fallback to basic extraction
+            metadata = {
+                "title": scraped["title"],
+                "author": "Unknown",
+                "source": urlparse(url).netloc,
+                "publish_date": added_date.strftime("%Y-%m-%d"),
+                "summary": scraped["short_excerpt"],
+                "tags": [],
+                "article_type": "news",
+                "key_points": [],
+            }
+
+        staged_image = image_future.result() if image_future else None
 
     # Generate unique slug
     slug = generate_unique_slug(metadata["title"], url, db)
     logger.info(f"Generated slug: {slug}")
 
-    # Extract cover image URL
-    console.print("[cyan]Extracting cover image...[/cyan]")
-    scraper_with_images = ArticleScraper(
-        raw_dir=config.get_articles_raw_dir(),
-        parsed_dir=config.get_articles_parsed_dir(),
-    )
-
-    # Fetch HTML for image extraction (skip cache if force)
-    if force:
-        html = scraper_with_images.fetch_article(url)
-    else:
-        # Try to load from raw cache first
-        raw_file = scraper_with_images.raw_dir / scraper_with_images._url_to_filename(url, "html")
-        if raw_file.exists():
-            with open(raw_file, "r", encoding="utf-8") as f:
-                html = f.read()
-        else:
-            html = scraper_with_images.fetch_article(url)
-
-    cover_image_url = None
+    # Move the staged image to its slug-based name
     cover_image_local = None
-
-    if html:
-        cover_image_url = scraper_with_images.extract_cover_image_url(html, url)
-        if cover_image_url:
-            console.print(f"[green]✓[/green] Cover image URL found")
-
-            # Skip WeChat images — they block external hotlinking
-            wechat_hosts = ("mmbiz.qpic.cn", "mmbiz.qlogo.cn", "wx.qlogo.cn")
-            if any(h in cover_image_url for h in wechat_hosts):
-                console.print(f"  [dim]⚠ Skipping WeChat image (hotlink blocked)[/dim]")
-            else:
-                # Download image during add phase
-                images_dir = Path(config.get_articles_images_dir())
-                cover_image_local = download_image(
-                    cover_image_url,
-                    images_dir,
-                    slug,
-                    force=force
-                )
+    if staged_image:
+        cover_image_local = f"{slug}{Path(staged_image).suffix}"
+        (images_dir / staged_image).replace(images_dir / cover_image_local)
 
     # Create article object (store local path instead of remote URL)
-    added_date = datetime.now()
     # Use publish_date from metadata, or fall back to added_date if empty
     publish_date = metadata.get("publish_date", "")
     if not publish_date or publish_date.strip() == "":
@@ -215,12 +229,10 @@ def add(
         article = db.add_article(article)
 
     # Save enriched content to file
-    enriched_dir = Path(config.get_articles_enriched_dir())
     enriched_dir.mkdir(parents=True, exist_ok=True)
 
     enriched_file = enriched_dir / f"{slug}.json"
-    with open(enriched_file, "w", encoding="utf-8") as f:
-        json.dump(article.to_dict(), f, ensure_ascii=False, indent=2, default=str)
+    enriched_file.write_bytes(orjson.dumps(article.to_dict(), option=orjson.OPT_INDENT_2, default=str))
 
     if existing and force:
         console.print(f"[green]✓[/green] Article updated successfully!")
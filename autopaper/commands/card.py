@@ -4,7 +4,6 @@ from pathlib import Path
 import typer
 from rich.console import Console
 
-from autopaper.ai import generate_infocard
 from autopaper.config import config
 
 console = Console()
@@ -15,6 +14,7 @@ def generate_card(
     output: str = typer.Option(None, "--output", "-o", help="Output SVG path"),
     style: str = typer.Option("tech", help="Card style (tech or news)"),
     content: str = typer.Option(None, "--content", "-c", help="Content file path (markdown)"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Ignore cached SVG and regenerate"),
 ):
     """Generate InfoQ-style technical summary card (landscape, 16:9).
 
@@ -23,12 +23,13 @@ def generate_card(
         output: Output SVG path (default: issues/{title}-infocard.svg)
         style: Card style (tech or news)
         content: Path to markdown file with content
+        no_cache: Ignore cached SVG and regenerate
     """
+    from autopaper.ai import generate_infocard
+
     # Determine output path
     if output is None:
-        issues_dir = Path(config.get_issues_dir())
-        safe_title = title.replace(" ", "-").replace("/", "-")[:50]
-        output = str(issues_dir / f"{safe_title}-infocard.svg")
+        output = _default_output_path(title)
 
     # Get content
     if content:
@@ -43,16 +44,7 @@ def generate_card(
 
     else:
         # Use sample content
-        markdown_content = f"""# {title}
-
-本周技术精选汇总，涵盖AI编程、云原生、系统架构等前沿技术话题。
-
-## 核心要点
-- AI编程工具从对话式向闭环式演进
-- 自主Agent架构成为新趋势
-- 云原生技术持续深化
-- 开发者工具链无缝集成
-"""
+        markdown_content = _sample_content(title)
 
     console.print(f"[cyan]Generating InfoQ-style technical card...[/cyan]")
     console.print(f"[dim]Title: {title}[/dim]")
@@ -61,13 +53,23 @@ def generate_card(
     console.print(f"[dim]Format: 1200x675 (16:9 landscape)[/dim]\n")
 
     try:
-        # Generate InfoQ card
-        svg_code = generate_infocard.generate_infocard(
-            content=markdown_content,
-            title=title,
-            style=style,
-            key_points=None,  # Let the skill extract from content
-        )
+        # Generate InfoQ card, streaming progress while the SVG is produced
+        with console.status("[cyan]Waiting for Claude...[/cyan]") as status:
+            received = 0
+
+            def _on_chunk(text: str):
+                nonlocal received
+                received += len(text)
+                status.update(f"[cyan]Receiving SVG... {received} chars[/cyan]")
+
+            svg_code = generate_infocard.generate_infocard(
+                content=markdown_content,
+                title=title,
+                style=style,
+                key_points=None,  # Let the skill extract from content
+                on_chunk=_on_chunk,
+                force=no_cache,
+            )
 
         # Save to file
         generate_infocard.save_infocard(svg_code, output)
@@ -83,3 +85,102 @@ def generate_card(
     except Exception as e:
         console.print(f"[red]Failed to generate card: {e}[/red]")
         raise typer.Exit(1)
+
+
+def generate_cards(
+    from_file: str = typer.Option(..., "--from-file", "-f", help="Text file with one card title per line"),
+    style: str = typer.Option("tech", help="Card style (tech or news)"),
+    batch: bool = typer.Option(False, "--batch", help="Submit all cards as one Message Batch (cheaper, asynchronous)"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Ignore cached SVGs and regenerate"),
+):
+    """Generate InfoQ-style cards for several titles at once.
+
+    Args:
+        from_file: Path to a text file with one title per line
+        style: Card style (tech or news)
+        batch: Use the Message Batches API instead of concurrent individual requests
+        no_cache: Ignore cached SVGs and regenerate (batch mode never reads the cache)
+    """
+    from autopaper.ai import generate_infocard
+
+    titles_path = Path(from_file)
+    if not titles_path.exists():
+        console.print(f"[red]Titles file not found: {titles_path}[/red]")
+        raise typer.Exit(1)
+
+    with open(titles_path, "r", encoding="utf-8") as f:
+        titles = [line.strip() for line in f if line.strip()]
+
+    if not titles:
+        console.print("[yellow]No titles found in file[/yellow]")
+        raise typer.Exit(0)
+
+    items = [
+        {"title": title, "content": _sample_content(title), "style": style, "force": no_cache}
+        for title in titles
+    ]
+
+    console.print(f"[cyan]Generating {len(items)} card(s)...[/cyan]")
+
+    try:
+        if batch:
+            from autopaper.ai import batch_infocard
+
+            console.print("[dim]Submitted as a batch; this may take several minutes[/dim]")
+            with console.status("[cyan]Waiting for batch to finish...[/cyan]"):
+                svgs = batch_infocard.generate_infocards_batch(items)
+        else:
+            from autopaper.ai import parallel
+
+            with console.status("[cyan]Generating cards concurrently...[/cyan]"):
+                svgs = parallel.generate_infocards_parallel(items)
+    except Exception as e:
+        console.print(f"[red]Failed to generate cards: {e}[/red]")
+        raise typer.Exit(1)
+
+    generated = 0
+    for item, svg_code in zip(items, svgs):
+        if not svg_code:
+            console.print(f"  [yellow]⚠ Failed: {item['title']}[/yellow]")
+            continue
+        output = _default_output_path(item["title"])
+        generate_infocard.save_infocard(svg_code, output)
+        console.print(f"  [dim]✓ {output}[/dim]")
+        generated += 1
+
+    console.print(f"[green]✓[/green] Generated {generated}/{len(items)} card(s)")
+
+
+def _default_output_path(title: str) -> str:
+    """Get the default SVG output path for a card title.
+
+    Args:
+        title: Card title
+
+    Returns:
+        Output path (issues/{title}-infocard.svg)
+    """
+    issues_dir = Path(config.get_issues_dir())
+    safe_title = title.replace(" ", "-").replace("/", "-")[:50]
+    return str(issues_dir / f"{safe_title}-infocard.svg")
+
+
+def _sample_content(title: str) -> str:
+    """Build placeholder markdown content for a card without a content file.
+
+    Args:
+        title: Card title
+
+    Returns:
+        Sample markdown content
+    """
+    return f"""# {title}
+
+本周技术精选汇总，涵盖AI编程、云原生、系统架构等前沿技术话题。
+
+## 核心要点
+- AI编程工具从对话式向闭环式演进
+- 自主Agent架构成为新趋势
+- 云原生技术持续深化
+- 开发者工具链无缝集成
+"""
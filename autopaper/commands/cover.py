@@ -1,11 +1,7 @@
 """Generate cover image command."""
-from pathlib import Path
-
 import typer
 from rich.console import Console
 
-from autopaper.config import config
-
 console = Console()
 
 
@@ -5,7 +5,7 @@ import typer
 from rich.console import Console
 
 from autopaper.config import config
-from autopaper.database import Database
+from autopaper.database import get_db
 
 console = Console()
 
@@ -23,7 +23,7 @@ def delete(
         article_id: Article ID to delete
         force: Skip confirmation prompt
     """
-    db = Database(config.get_database_path())
+    db = get_db()
 
     # Get article first to show info and get slug for file cleanup
     article = db.get_article_by_id(article_id)
@@ -1,21 +1,60 @@
 """Export PDF command."""
+import hashlib
+import json
 import os
 import re
+import shutil
+import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterable
 from urllib.parse import urlparse
 
 import requests
 import typer
-from jinja2 import Template
 from PIL import Image
 from rich.console import Console
 
 from autopaper.config import config
-from autopaper.database import Database
+from autopaper.database import get_db
+from autopaper.models import TAGS_PREFIXES, URL_PREFIXES
+from autopaper.utils.templates import get_template
 
 console = Console()
 
+# Page widths (mm) for supported pdf.page_size values
+_PAGE_WIDTHS_MM = {"A4": 210.0, "A5": 148.0, "Letter": 215.9}
+
+# LibreOffice PDF export options (JSON filter syntax, LibreOffice 7.4+): downsample
+# embedded images to print resolution and JPEG-encode them, like a print-ready export.
+# Older LibreOffice versions fall back to a plain "pdf" conversion.
+_PDF_EXPORT_FILTER = "pdf:writer_web_pdf_Export:" + json.dumps({
+    "ReduceImageResolution": {"type": "boolean", "value": "true"},
+    "MaxImageResolution": {"type": "long", "value": "150"},
+    "UseLosslessCompression": {"type": "boolean", "value": "false"},
+    "Quality": {"type": "long", "value": "80"},
+})
+
+# Markdown patterns used by _markdown_to_html
+_RE_LINK = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_RE_BOLD_STAR = re.compile(r'\*\*(.*?)\*\*')
+_RE_BOLD_UNDER = re.compile(r'__(.*?)__')
+_RE_ITALIC_STAR = re.compile(r'(?<!\*)\*([^*]+)\*(?!\*)')
+_RE_ITALIC_UNDER = re.compile(r'(?<!_)_([^_]+)_(?!_)')
+_RE_CODE = re.compile(r'`([^`]+)`')
+_RE_TREND = re.compile(r'^(\d+)\.\s+\*\*(.*?)\*\*:\s*(.*)')
+_RE_NUMBERED = re.compile(r'^(\d+)\.\s+(.*)')
+_RE_BULLET = re.compile(r'^[-*+]\s+')
+
+# Level-2 headings delimit issue sections
+_RE_H2 = re.compile(r'^## (.*)$', re.MULTILINE)
+
+# Article block references: [[slug]] and the target of a [text](url) / ![alt](src) link
+_RE_WIKILINK = re.compile(r'\[\[(.*?)\]\]')
+_RE_LINK_TARGET = re.compile(r'\]\(([^)]*)\)')
+
 
 def export_pdf(
     issue_slug: str = typer.Argument(..., help="Issue slug (e.g., 2026-W04-tech)"),
@@ -30,7 +69,7 @@ def export_pdf(
         output: Custom output path (default: issues/{slug}.pdf)
         no_card: Skip InfoQ card generation for faster export
     """
-    db = Database(config.get_database_path())
+    db = get_db()
 
     # Get issue from database
     issue = db.get_issue_by_slug(issue_slug)
@@ -42,15 +81,6 @@ def export_pdf(
 
     console.print(f"[cyan]Exporting issue: {issue_slug}[/cyan]")
 
-    # Ensure database has cover_image column
-    try:
-        with db.get_connection() as conn:
-            # Try to alter table to add cover_image column if not exists
-            conn.execute("ALTER TABLE articles ADD COLUMN cover_image TEXT")
-    except Exception:
-        # Column already exists or error occurred
-        pass
-
     # Read issue markdown
     issues_dir = Path(config.get_issues_dir())
     issue_file = issues_dir / f"{issue_slug}.md"
@@ -62,20 +92,31 @@ def export_pdf(
     with open(issue_file, "r", encoding="utf-8") as f:
         issue_markdown = f.read()
 
-    # Parse issue to extract sections
+    # Determine title (needed for card generation)
+    if issue.issue_type == "tech":
+        title = f"本周技术精选 · {issue.slug[:8]}"
+    else:
+        title = f"本周行业动态 · {issue.slug[:8]}"
+
+    # Generate AI card and convert to PNG (optional, can be slow).
+    # It only needs the raw markdown, so it runs in the background while sections are processed.
+    card_future = None
+    if not no_card:
+        console.print("[cyan]Generating AI card...[/cyan]")
+        card_executor = ThreadPoolExecutor(max_workers=1)
+        card_future = card_executor.submit(
+            _generate_and_convert_card, issue_markdown, title, issue.issue_type, issues_dir, issue_slug
+        )
+        card_executor.shutdown(wait=False)
+    else:
+        console.print("[dim]Skipping AI card generation (--no-card flag)[/dim]")
+
+    # Parse issue to extract sections, converting markdown to HTML in the same pass
     parse_start = time.time()
-    sections = _parse_issue_markdown(issue_markdown)
+    sections = _parse_issue_markdown(issue_markdown, convert=True)
     parse_time = time.time() - parse_start
 
-    # Convert markdown sections to HTML
-    convert_start = time.time()
-    if sections.get("introduction"):
-        sections["introduction"] = _markdown_to_html(sections["introduction"])
-    if sections.get("trends"):
-        sections["trends"] = _markdown_to_html(sections["trends"])
-    convert_time = time.time() - convert_start
-
-    console.print(f"[dim]Parsed in {parse_time:.2f}s, Converted in {convert_time:.2f}s[/dim]")
+    console.print(f"[dim]Parsed and converted in {parse_time:.2f}s[/dim]")
 
     # Use local cached images (downloaded during add phase)
     images_dir = issues_dir / f"{issue_slug}_images"
@@ -84,31 +125,22 @@ def export_pdf(
     console.print("[cyan]Processing cover images...[/cyan]")
 
     # Create slug to article mapping from database
-    articles = db.get_articles()
-    slug_to_cover = {article.slug: article.cover_image for article in articles}
-    slug_to_url = {article.slug: article.url for article in articles}
+    slug_info = {article.slug: (article.cover_image, article.url) for article in db.list_articles_summary()}
 
     # Copy cached images to issue directory
     articles_images_dir = Path(config.get_articles_images_dir())
+    pending_copies = []
     for block in sections.get("article_blocks", []):
         slug = block.get("slug", "")
 
-        # Get local cover image path from database
-        cover_local = slug_to_cover.get(slug, "")
+        # Get local cover image path and URL from database
+        cover_local, article_url = slug_info.get(slug, ("", ""))
 
         if cover_local:
             # Check if source image exists
             source_path = articles_images_dir / cover_local
             if source_path.exists():
-                # Copy to issue images directory
-                import shutil
-                dest_path = images_dir / cover_local
-                if not dest_path.exists():
-                    shutil.copy2(source_path, dest_path)
-                    console.print(f"  [dim]✓ Copied: {slug}[/dim]")
-                else:
-                    console.print(f"  [dim]✓ Using cache: {slug}[/dim]")
-
+                pending_copies.append((slug, source_path, images_dir / cover_local))
                 block["cover_image"] = f"{images_dir.name}/{cover_local}"
             else:
                 console.print(f"  [yellow]⚠ Image not found: {cover_local}[/yellow]")
@@ -118,37 +150,30 @@ def export_pdf(
 
         # Add URL if not present
         if not block.get("url"):
-            block["url"] = slug_to_url.get(slug, "")
+            block["url"] = article_url
 
-        # Convert markdown content to HTML
-        if block.get("content"):
-            block["content"] = _markdown_to_html(block["content"])
+    # Copies are disk-bound and independent, so overlap them
+    unique_copies = {dest: source for _, source, dest in pending_copies}
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        copied = dict(zip(unique_copies, executor.map(_copy_cover, unique_copies.values(), unique_copies)))
 
-    # Determine title (needed for card generation)
-    if issue.issue_type == "tech":
-        title = f"本周技术精选 · {issue.slug[:8]}"
-    else:
-        title = f"本周行业动态 · {issue.slug[:8]}"
+    for slug, _, dest in pending_copies:
+        if copied.pop(dest, False):
+            console.print(f"  [dim]✓ Copied: {slug}[/dim]")
+        else:
+            console.print(f"  [dim]✓ Using cache: {slug}[/dim]")
 
-    # Generate AI card and convert to PNG (optional, can be slow)
-    card_png_path = None
-    if not no_card:
-        console.print("[cyan]Generating AI card...[/cyan]")
-        card_png_path = _generate_and_convert_card(issue_markdown, title, issue.issue_type, issues_dir, issue_slug)
-    else:
-        console.print("[dim]Skipping AI card generation (--no-card flag)[/dim]")
+    # Wait for the AI card before rendering
+    card_png_path = card_future.result() if card_future else None
 
     # Render HTML template
-    template_path = Path(__file__).parent.parent / "templates" / "issue.html.j2"
-
-    with open(template_path, "r", encoding="utf-8") as f:
-        template = Template(f.read())
+    template = get_template("issue.html.j2")
 
     # Render HTML
     html_content = template.render(
         title=title,
         week_range=f"{issue.start_date} to {issue.end_date}",
-        generated_at=issue.created_at.strftime("%Y-%m-%d") if issue.created_at else "",
+        generated_at=issue.created_at.date().isoformat() if issue.created_at else "",
         ai_card=card_png_path,
         **sections,
     )
@@ -172,28 +197,34 @@ def export_pdf(
     console.print("[cyan]Generating PDF via LibreOffice...[/cyan]")
 
     try:
-        import subprocess
         pdf_start = time.time()
 
         soffice = "/Applications/LibreOffice.app/Contents/MacOS/soffice"
-        result = subprocess.run(
-            [
-                soffice, "--headless",
-                "--convert-to", "pdf",
-                str(html_output_path),
-                "--outdir", str(issues_dir),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=120,
-        )
+
+        def convert(target: str) -> subprocess.CompletedProcess:
+            return subprocess.run(
+                [
+                    soffice, "--headless",
+                    "--convert-to", target,
+                    str(html_output_path),
+                    "--outdir", str(issues_dir),
+                ],
+                capture_output=True,
+                text=True,
+                timeout=120,
+            )
+
+        result = convert(_PDF_EXPORT_FILTER)
+        if result.returncode != 0:
+            # LibreOffice before 7.4 rejects JSON filter options; export without them
+            console.print("[yellow]⚠ PDF image compression not supported, exporting uncompressed[/yellow]")
+            result = convert("pdf")
         if result.returncode != 0:
             raise RuntimeError(result.stderr or result.stdout)
 
         # LibreOffice outputs <basename>.pdf in outdir
         lo_output = issues_dir / f"{issue_slug}.pdf"
         if output is not None and Path(output) != lo_output:
-            import shutil
             shutil.move(str(lo_output), output)
             output_path = Path(output)
         else:
@@ -209,9 +240,30 @@ def export_pdf(
 
 
 
+def _copy_cover(source_path: Path, dest_path: Path) -> bool:
+    """Copy a cover image into the issue directory unless already present.
+
+    Args:
+        source_path: Cached cover image
+        dest_path: Destination in the issue images directory
+
+    Returns:
+        True if the image was copied, False if it already existed
+    """
+    if dest_path.exists():
+        return False
+
+    # copyfile uses sendfile/fcopyfile where available; file metadata isn't needed here
+    shutil.copyfile(source_path, dest_path)
+    return True
+
+
+@lru_cache(maxsize=512)
 def _markdown_to_html(markdown_text: str) -> str:
     """Convert markdown text to HTML.
 
+    Results are memoized, so repeated snippets are only rendered once per process.
+
     Args:
         markdown_text: Markdown formatted text
 
@@ -221,17 +273,36 @@ def _markdown_to_html(markdown_text: str) -> str:
     if not markdown_text:
         return ""
 
+    return _markdown_lines_to_html(markdown_text.split('\n'))
+
+
+def _markdown_lines_to_html(lines: Iterable[str]) -> str:
+    """Convert markdown lines to HTML.
+
+    Args:
+        lines: Markdown lines, without line terminators
+
+    Returns:
+        HTML formatted string
+    """
     def _inline(text: str) -> str:
+        # Each pattern needs its marker in the text; the substring checks are far
+        # cheaper than a regex scan, and most lines carry little or no markup.
         # Convert links first to avoid interfering with emphasis parsing.
-        text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', text)
-        text = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', text)
-        text = re.sub(r'__(.*?)__', r'<strong>\1</strong>', text)
-        text = re.sub(r'(?<!\*)\*([^*]+)\*(?!\*)', r'<em>\1</em>', text)
-        text = re.sub(r'(?<!_)_([^_]+)_(?!_)', r'<em>\1</em>', text)
-        text = re.sub(r'`([^`]+)`', r'<code>\1</code>', text)
+        if "](" in text:
+            text = _RE_LINK.sub(r'<a href="\2">\1</a>', text)
+        if "**" in text:
+            text = _RE_BOLD_STAR.sub(r'<strong>\1</strong>', text)
+        if "__" in text:
+            text = _RE_BOLD_UNDER.sub(r'<strong>\1</strong>', text)
+        if "*" in text:
+            text = _RE_ITALIC_STAR.sub(r'<em>\1</em>', text)
+        if "_" in text:
+            text = _RE_ITALIC_UNDER.sub(r'<em>\1</em>', text)
+        if "`" in text:
+            text = _RE_CODE.sub(r'<code>\1</code>', text)
         return text
 
-    lines = markdown_text.split('\n')
     result = []
     paragraph_lines = []
     in_bullet_list = False
@@ -256,39 +327,47 @@ def _markdown_to_html(markdown_text: str) -> str:
             close_bullets()
             continue
 
-        if line.startswith("### "):
-            flush_paragraph()
-            close_bullets()
-            result.append(f'<h4>{_inline(line[4:].strip())}</h4>')
-            continue
-
-        trend_match = re.match(r'^(\d+)\.\s+\*\*(.*?)\*\*:\s*(.*)', line)
-        if trend_match:
-            flush_paragraph()
-            close_bullets()
-            number, title, content = trend_match.groups()
-            result.append('<div class="trend-item">')
-            result.append(f'<span class="trend-number">{number}.</span>')
-            result.append(f'<strong class="trend-title">{_inline(title)}:</strong> {_inline(content)}')
-            result.append('</div>')
-            continue
+        # Dispatch on the first character so regexes only run on candidate lines
+        first = line[0]
 
-        num_match = re.match(r'^(\d+)\.\s+(.*)', line)
-        if num_match:
+        if first == "#" and line.startswith("### "):
             flush_paragraph()
             close_bullets()
-            number, content = num_match.groups()
-            result.append(f'<p class="numbered-paragraph"><strong>{number}.</strong> {_inline(content)}</p>')
+            result.append(f'<h4>{_inline(line[4:].strip())}</h4>')
             continue
 
-        if re.match(r'^[-*+]\s+', line):
-            flush_paragraph()
-            if not in_bullet_list:
-                result.append('<ul>')
-                in_bullet_list = True
-            bullet_text = re.sub(r'^[-*+]\s+', '', line)
-            result.append(f'<li>{_inline(bullet_text)}</li>')
-            continue
+        if first.isdigit():
+            trend_match = _RE_TREND.match(line)
+            if trend_match:
+                flush_paragraph()
+                close_bullets()
+                number, title, content = trend_match.groups()
+                result.append(
+                    f'<div class="trend-item">\n'
+                    f'<span class="trend-number">{number}.</span>\n'
+                    f'<strong class="trend-title">{_inline(title)}:</strong> {_inline(content)}\n'
+                    f'</div>'
+                )
+                continue
+
+            num_match = _RE_NUMBERED.match(line)
+            if num_match:
+                flush_paragraph()
+                close_bullets()
+                number, content = num_match.groups()
+                result.append(f'<p class="numbered-paragraph"><strong>{number}.</strong> {_inline(content)}</p>')
+                continue
+
+        elif first in "-*+":
+            bullet_match = _RE_BULLET.match(line)
+            if bullet_match:
+                flush_paragraph()
+                if not in_bullet_list:
+                    result.append('<ul>')
+                    in_bullet_list = True
+                bullet_text = line[bullet_match.end():]
+                result.append(f'<li>{_inline(bullet_text)}</li>')
+                continue
 
         close_bullets()
         paragraph_lines.append(line)
@@ -299,11 +378,13 @@ def _markdown_to_html(markdown_text: str) -> str:
     return '\n'.join(result)
 
 
-def _parse_issue_markdown(markdown: str) -> dict:
+def _parse_issue_markdown(markdown: str, convert: bool = False) -> dict:
     """Parse issue markdown into sections.
 
     Args:
         markdown: Issue markdown content
+        convert: Also convert the introduction, trends and article block
+            content to HTML while parsing
 
     Returns:
         Dictionary with sections: introduction, trends, article_blocks, news_briefs
@@ -324,49 +405,37 @@ def _parse_issue_markdown(markdown: str) -> dict:
         "快讯速览": "news_briefs",
     }
 
-    lines = markdown.split("\n")
-    current_section = None
-    current_content = []
+    headers = list(_RE_H2.finditer(markdown))
 
-    for line in lines:
-        if line.startswith("## "):
-            # Save previous section
-            if current_section:
-                if current_section == "article_blocks":
-                    # Parse article blocks
-                    sections[current_section] = _parse_article_blocks("\n".join(current_content))
-                elif current_section == "news_briefs":
-                    # Parse news briefs
-                    sections[current_section] = _parse_news_briefs("\n".join(current_content))
-                else:
-                    sections[current_section] = "\n".join(current_content).strip()
-
-            # Start new section
-            section_name = line[3:].strip()
-            # Map Chinese/English names to keys
-            current_section = section_map.get(section_name, section_name.lower().replace(" ", "_"))
-            current_content = []
+    for index, header in enumerate(headers):
+        section_name = header.group(1).strip()
+        # Map Chinese/English names to keys
+        current_section = section_map.get(section_name, section_name.lower().replace(" ", "_"))
+        if not current_section:
+            continue
 
-        else:
-            current_content.append(line)
+        # Section body runs from the line after the heading to the line before the next one
+        body_end = headers[index + 1].start() - 1 if index + 1 < len(headers) else len(markdown)
+        body = markdown[header.end() + 1:body_end]
 
-    # Save last section
-    if current_section:
         if current_section == "article_blocks":
-            sections[current_section] = _parse_article_blocks("\n".join(current_content))
+            sections[current_section] = _parse_article_blocks(body, convert=convert)
         elif current_section == "news_briefs":
-            sections[current_section] = _parse_news_briefs("\n".join(current_content))
+            sections[current_section] = _parse_news_briefs(body)
+        elif convert and current_section in ("introduction", "trends"):
+            sections[current_section] = _markdown_to_html(body)
         else:
-            sections[current_section] = "\n".join(current_content).strip()
+            sections[current_section] = body.strip()
 
     return sections
 
 
-def _parse_article_blocks(content: str) -> list:
+def _parse_article_blocks(content: str, convert: bool = False) -> list:
     """Parse article blocks from markdown.
 
     Args:
         content: Article section content
+        convert: Convert each block's content to HTML from its collected lines
 
     Returns:
         List of article block dictionaries
@@ -375,19 +444,22 @@ def _parse_article_blocks(content: str) -> list:
     current_block = None
     current_content = []
 
+    def block_content(lines: list) -> str:
+        if convert:
+            return _markdown_lines_to_html(lines)
+        return "\n".join(lines).strip()
+
     lines = content.split("\n")
 
     for line in lines:
         # Check for wikilink slug FIRST (before ###)
-        if "[[" in line and "]]" in line and line.strip().startswith("[["):
+        if "]]" in line and line.lstrip().startswith("[["):
             # Extract slug reference that appears before title
-            start = line.find("[[") + 2
-            end = line.find("]]", start)
-            slug = line[start:end]
+            slug = _RE_WIKILINK.search(line).group(1)
 
             # Save previous block if exists and is complete
             if current_block and (current_block.get("title") or current_block.get("content")):
-                current_block["content"] = "\n".join(current_content).strip()
+                current_block["content"] = block_content(current_content)
                 blocks.append(current_block)
                 current_content = []
 
@@ -411,7 +483,7 @@ def _parse_article_blocks(content: str) -> list:
             else:
                 # Save previous block if exists
                 if current_block:
-                    current_block["content"] = "\n".join(current_content).strip()
+                    current_block["content"] = block_content(current_content)
                     if current_block.get("title") or current_block.get("slug"):
                         blocks.append(current_block)
                     current_content = []
@@ -426,24 +498,20 @@ def _parse_article_blocks(content: str) -> list:
                     "cover_image": None
                 }
 
-        elif line.startswith("**标签**:") or line.startswith("**Tags**:"):
+        elif line.startswith(TAGS_PREFIXES):
             # Extract tags
             tags_line = line.split(":", 1)[1].strip()
             tags = [t.strip() for t in tags_line.split(",")]
             if current_block:
                 current_block["tags"] = tags
 
-        elif line.startswith("**原文链接**:") or line.startswith("**Original URL**:"):
+        elif line.startswith(URL_PREFIXES):
             # Extract URL
             url_line = line.split(":", 1)[1].strip()
             # Extract URL from markdown format: [text](url)
-            if "](" in url_line:
-                url_start = url_line.find("](") + 2
-                url_end = url_line.find(")", url_start)
-                if url_end > url_start:
-                    url = url_line[url_start:url_end]
-                    if current_block:
-                        current_block["url"] = url
+            link = _RE_LINK_TARGET.search(url_line)
+            if link and link.group(1) and current_block:
+                current_block["url"] = link.group(1)
 
         elif line.startswith("<!-- SLUG:"):
             # Extract hidden slug
@@ -453,20 +521,16 @@ def _parse_article_blocks(content: str) -> list:
 
         elif line.startswith("!["):
             # Extract cover image
-            if "](" in line:
-                img_start = line.find("](") + 2
-                img_end = line.find(")", img_start)
-                if img_end > img_start:
-                    img_url = line[img_start:img_end]
-                    if current_block:
-                        current_block["cover_image"] = img_url
+            link = _RE_LINK_TARGET.search(line)
+            if link and link.group(1) and current_block:
+                current_block["cover_image"] = link.group(1)
 
         else:
             current_content.append(line)
 
     # Save last block
     if current_block:
-        current_block["content"] = "\n".join(current_content).strip()
+        current_block["content"] = block_content(current_content)
         blocks.append(current_block)
 
     return blocks
@@ -498,6 +562,31 @@ def _parse_news_briefs(content: str) -> list:
     return briefs
 
 
+def _card_raster_size() -> tuple:
+    """Compute the AI card PNG size from its printed width in the PDF.
+
+    The card spans the text block, so it is rasterized at ``pdf.card_dpi``
+    over the page width minus the left and right margins.
+
+    Returns:
+        Tuple of (width, height) in pixels, 16:9
+    """
+    pdf_config = config.get_pdf_config()
+
+    def _mm(value, default: float) -> float:
+        try:
+            return float(str(value).lower().replace("mm", "").strip())
+        except ValueError:
+            return default
+
+    page_width = _PAGE_WIDTHS_MM.get(pdf_config.get("page_size", "A4"), _PAGE_WIDTHS_MM["A4"])
+    text_width = page_width - _mm(pdf_config.get("margin_left"), 15.0) - _mm(pdf_config.get("margin_right"), 15.0)
+    dpi = pdf_config.get("card_dpi", 150)
+
+    width = round(text_width / 25.4 * dpi)
+    return width, round(width * 9 / 16)
+
+
 def _generate_and_convert_card(
     issue_markdown: str, title: str, issue_type: str, issues_dir: Path, issue_slug: str
 ) -> str:
@@ -513,6 +602,18 @@ def _generate_and_convert_card(
     Returns:
         Path to generated PNG file (relative to images_dir)
     """
+    card_png_path = issues_dir / f"{issue_slug}-aicard.png"
+
+    # A hash of the card inputs is stored next to the PNG, so an unchanged issue reuses the last render
+    card_key_path = issues_dir / f"{issue_slug}-aicard.key"
+    width, height = _card_raster_size()
+    key_source = f"{issue_markdown}\0{title}\0{issue_type}\0{width}x{height}"
+    key = hashlib.blake2b(key_source.encode("utf-8"), digest_size=16).hexdigest()
+
+    if card_png_path.exists() and card_key_path.exists() and card_key_path.read_text() == key:
+        console.print(f"  [dim]✓ Using cached AI card: {card_png_path.name}[/dim]")
+        return card_png_path.name
+
     try:
         # Import skill
         from autopaper.ai import generate_infocard
@@ -527,15 +628,13 @@ def _generate_and_convert_card(
         generate_infocard.save_infocard(svg_code, str(card_svg_path))
 
         # Convert SVG to PNG using cairosvg (with better font handling)
-        card_png_path = issues_dir / f"{issue_slug}-aicard.png"
-
         try:
             import cairosvg
 
             with open(card_svg_path, "rb") as svg_file:
                 svg_data = svg_file.read()
                 # Use output_width/output_height for precise size control
-                png_data = cairosvg.svg2png(bytestring=svg_data, output_width=2400, output_height=1350)
+                png_data = cairosvg.svg2png(bytestring=svg_data, output_width=width, output_height=height)
 
             with open(card_png_path, "wb") as png_file:
                 png_file.write(png_data)
@@ -556,6 +655,8 @@ def _generate_and_convert_card(
                 console.print("[dim]SVG file saved, but PNG conversion skipped[/dim]")
                 return card_svg_path.name
 
+        card_key_path.write_text(key)
+
         console.print(f"  [dim]✓ AI card generated: {card_png_path.name}[/dim]")
         return card_png_path.name
 
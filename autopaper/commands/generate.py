@@ -6,15 +6,14 @@ from pathlib import Path
 from typing import Optional
 
 import typer
-from jinja2 import Template
 from rich.console import Console
 
-from autopaper.ai import compose_issue
 from autopaper.config import config
-from autopaper.database import Database
+from autopaper.database import get_db
 from autopaper.utils.date import get_week_id, get_last_week_id, get_week_range
 from autopaper.utils.logging import get_logger
 from autopaper.utils.json_parser import safe_parse_json
+from autopaper.utils.templates import get_template
 
 console = Console()
 logger = get_logger(__name__)
@@ -38,12 +37,14 @@ def generate(
         slug: Custom issue slug
         sync_obsidian: Sync to Obsidian after generating
     """
+    from autopaper.ai import compose_issue
+
     # Validate issue_type
     if issue_type not in ["tech", "news"]:
         console.print(f"[red]Invalid issue type: {issue_type}. Must be 'tech' or 'news'[/red]")
         raise typer.Exit(1)
 
-    db = Database(config.get_database_path())
+    db = get_db()
 
     # Determine week
     week_id = get_last_week_id() if last_week else get_week_id()
@@ -75,27 +76,31 @@ def generate(
         raise typer.Exit(1)
 
     # Ensure URLs and tags are included in article_blocks
-    # Create a mapping from slug to URL, cover_image, and tags
-    slug_to_url = {article.slug: article.url for article in articles}
-    slug_to_cover = {article.slug: article.cover_image for article in articles}
-    slug_to_tags = {article.slug: article.tags for article in articles}
+    # Create a mapping from slug to (URL, cover_image, tags) in a single pass
+    slug_info = {article.slug: (article.url, article.cover_image, article.tags) for article in articles}
 
     # Add URLs, cover images, and fix tags to article_blocks if missing
     for block in issue_data.get("article_blocks", []):
+        url, cover_image, tags = slug_info.get(block.get("slug", ""), ("", None, []))
         if "url" not in block or not block["url"]:
-            block["url"] = slug_to_url.get(block.get("slug", ""), "")
+            block["url"] = url
         if "cover_image" not in block or not block["cover_image"]:
-            block["cover_image"] = slug_to_cover.get(block.get("slug", ""))
+            block["cover_image"] = cover_image
         # Ensure tags is a list, not a string
-        if "tags" in block and isinstance(block["tags"], str):
-            try:
-                block["tags"] = json.loads(block["tags"])
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse tags as JSON for {block.get('slug')}: {e}")
-                block["tags"] = [block["tags"]]
+        tags_value = block.get("tags")
+        if isinstance(tags_value, str):
+            if tags_value.lstrip().startswith("["):
+                try:
+                    block["tags"] = json.loads(tags_value)
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Failed to parse tags as JSON for {block.get('slug')}: {e}")
+                    block["tags"] = [tags_value]
+            else:
+                # A plain string is a single tag; no point attempting a JSON parse
+                block["tags"] = [tags_value]
         # If tags is empty or missing, use original article tags
         if not block.get("tags"):
-            block["tags"] = slug_to_tags.get(block.get("slug", ""), [])
+            block["tags"] = tags
 
     # Generate slug
     if slug is None:
@@ -104,10 +109,7 @@ def generate(
         slug = slug
 
     # Render Markdown template
-    template_path = Path(__file__).parent.parent / "templates" / "issue.md.j2"
-
-    with open(template_path, "r", encoding="utf-8") as f:
-        template = Template(f.read())
+    template = get_template("issue.md.j2")
 
     # Determine title
     if issue_type == "tech":
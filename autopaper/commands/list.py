@@ -1,17 +1,58 @@
 """List articles command."""
 import sys
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
-from autopaper.config import config
-from autopaper.database import Database
+from autopaper.database import get_db
 
 console = Console()
 
 
+def _truncate(text: str, width: int, suffix: str) -> str:
+    """Shorten text to fit a column, marking the cut with a suffix.
+
+    Args:
+        text: Text to shorten
+        width: Maximum length before the text is cut
+        suffix: Marker appended to cut text (e.g., "...")
+
+    Returns:
+        Text of at most width characters
+    """
+    return text[: width - len(suffix)] + suffix if len(text) > width else text
+
+
+def _format_tags(tags: Optional[List[str]]) -> str:
+    """Format the first two tags plus a count of the rest.
+
+    Args:
+        tags: Article tags
+
+    Returns:
+        Tag summary (e.g., "ai, rust +3")
+    """
+    tags = tags or []
+    tag_count = len(tags)
+    return ", ".join(tags[:2]) + (f" +{tag_count - 2}" if tag_count > 2 else "")
+
+
+def _format_added_date(d: Optional[datetime]) -> str:
+    """Format an added date as YYYY-MM-DD HH:MM.
+
+    Args:
+        d: Date the article was added
+
+    Returns:
+        Formatted date, or "" if unknown
+    """
+    if not d:
+        return ""
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d} {d.hour:02d}:{d.minute:02d}"
+
+
 def list_articles(
     tag: Optional[str] = typer.Option(None, "--tag", "-t", help="Filter by tag"),
     article_type: Optional[str] = typer.Option(None, "--type", help="Filter by type (technical/news)"),
@@ -28,16 +69,18 @@ def list_articles(
         limit: Maximum number of articles to display
         verbose: Show detailed information including URL and source
     """
-    db = Database(config.get_database_path())
+    db = get_db()
 
     # Get articles
-    articles = db.list_articles(tag=tag, article_type=article_type, limit=limit)
+    articles = db.list_articles_summary(tag=tag, article_type=article_type, limit=limit)
 
     if not articles:
         console.print("[yellow]No articles found.[/yellow]")
         raise typer.Exit(0)
 
-    # Create table
+    # Create table (Table is only needed here, so it is imported on use)
+    from rich.table import Table
+
     if verbose:
         # Verbose mode: wider table with URL
         table = Table(title="Articles", width=None)
@@ -58,42 +101,36 @@ def list_articles(
         table.add_column("Pub", width=10)
         table.add_column("Added", style="yellow", width=14)
 
-    for article in articles:
-        tags_str = ", ".join(article.tags[:2]) if article.tags else ""
-        if len(article.tags) > 2:
-            tags_str += f" +{len(article.tags) - 2}"
-
-        # Format added date
-        if article.added_date:
-            added_str = article.added_date.strftime("%Y-%m-%d %H:%M")
-        else:
-            added_str = ""
-
-        if verbose:
-            # Verbose mode: show all details including URL
-            title_short = article.title[:30] + "..." if len(article.title) > 33 else article.title
-            url_short = article.url[:40] + "..." if len(article.url) > 43 else article.url
-            source_short = article.source[:8] + ".." if len(article.source) > 10 else article.source
-
-            table.add_row(
+    if verbose:
+        # Verbose mode: show all details including URL
+        rows = [
+            (
                 str(article.id),
-                title_short,
-                source_short,
-                url_short,
+                _truncate(article.title, 33, "..."),
+                _truncate(article.source, 10, ".."),
+                _truncate(article.url, 43, "..."),
                 article.publish_date or "",
-                added_str,
+                _format_added_date(article.added_date),
             )
-        else:
-            # Normal mode: concise view
-            table.add_row(
+            for article in articles
+        ]
+    else:
+        # Normal mode: concise view
+        rows = [
+            (
                 str(article.id),
-                article.title[:37] + "..." if len(article.title) > 40 else article.title,
-                article.source[:10] + ".." if len(article.source) > 12 else article.source,
+                _truncate(article.title, 40, "..."),
+                _truncate(article.source, 12, ".."),
                 article.article_type,
-                tags_str,
+                _format_tags(article.tags),
                 article.publish_date or "",
-                added_str,
+                _format_added_date(article.added_date),
             )
+            for article in articles
+        ]
+
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
     console.print(f"\n[dim]Total: {len(articles)} article(s)[/dim]")
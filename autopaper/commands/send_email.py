@@ -1,12 +1,14 @@
 """Send email command."""
+import os
 import sys
+from contextlib import redirect_stdout
 from pathlib import Path
 
 import typer
 from rich.console import Console
 
 from autopaper.config import config
-from autopaper.database import Database
+from autopaper.database import get_db
 from autopaper.publishers.email import EmailPublisher
 
 console = Console()
@@ -28,7 +30,7 @@ def send_email(
         no_markdown: Don't attach Markdown file
         subject: Custom email subject
     """
-    db = Database(config.get_database_path())
+    db = get_db()
 
     # Get issue from database
     issue = db.get_issue_by_slug(issue_slug)
@@ -44,13 +46,12 @@ def send_email(
     issues_dir = Path(config.get_issues_dir())
     issue_file = issues_dir / f"{issue_slug}.md"
 
-    if not issue_file.exists():
+    try:
+        issue_markdown = issue_file.read_text(encoding="utf-8")
+    except FileNotFoundError:
         console.print(f"[red]Issue file not found: {issue_file}[/red]")
         raise typer.Exit(1)
 
-    with open(issue_file, "r", encoding="utf-8") as f:
-        issue_markdown = f.read()
-
     # Generate PDF if needed
     pdf_path = None
     if not no_pdf:
@@ -103,17 +104,13 @@ def _generate_pdf(issue_slug: str, issue) -> str:
     Returns:
         Path to generated PDF
     """
-    # Import export functionality
+    # Export pulls in the PDF toolchain, so it is only imported when a PDF is needed
     from autopaper.commands import export
 
-    # Temporarily redirect stdout to suppress export output
-    import io
-    from contextlib import redirect_stdout
-
     output_path = Path(config.get_issues_dir()) / f"{issue_slug}.pdf"
 
-    # Capture output to avoid cluttering the console
-    with io.StringIO() as buf, redirect_stdout(buf):
+    # Discard output to avoid cluttering the console
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
         # Call export_pdf function
         export.export_pdf(issue_slug, output=str(output_path), no_card=True)
 
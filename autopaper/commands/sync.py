@@ -1,4 +1,5 @@
 """Sync to Obsidian command."""
+import re
 import sys
 from pathlib import Path
 
@@ -6,10 +7,14 @@ import typer
 from rich.console import Console
 
 from autopaper.config import config
-from autopaper.database import Database
+from autopaper.database import get_db
+from autopaper.publishers.obsidian import ObsidianPublisher
 
 console = Console()
 
+# Obsidian wikilinks to articles, e.g. [[article-slug]]
+_WIKILINK_RE = re.compile(r"\[\[([^\]]+)\]\]")
+
 
 def sync(
     target: str = typer.Argument(..., help="Sync target (currently only 'obsidian')"),
@@ -26,7 +31,7 @@ def sync(
         console.print("[dim]Currently only 'obsidian' is supported[/dim]")
         raise typer.Exit(1)
 
-    db = Database(config.get_database_path())
+    db = get_db()
 
     # Get issue from database
     issue = db.get_issue_by_slug(issue_slug)
@@ -37,9 +42,7 @@ def sync(
 
     # Get articles for this issue
     # Extract article slugs from issue content
-    import re
-
-    article_slugs = re.findall(r"\[\[([^\]]+)\]\]", issue.content)
+    article_slugs = _WIKILINK_RE.findall(issue.content)
 
     if not article_slugs:
         console.print("[yellow]No articles found in issue[/yellow]")
@@ -48,19 +51,17 @@ def sync(
     console.print(f"[cyan]Found {len(article_slugs)} article(s) in issue[/cyan]")
 
     # Get article objects
-    articles = []
-    for slug in article_slugs:
-        article = db.get_article_by_slug(slug)
-        if article:
-            articles.append(article)
+    by_slug = {article.slug: article for article in db.get_articles_by_slugs(article_slugs)}
+    articles = [by_slug[slug] for slug in article_slugs if slug in by_slug]
+
+    missing = [slug for slug in article_slugs if slug not in by_slug]
+    if missing:
+        console.print(f"[yellow]Skipping unknown article(s):[/yellow] {', '.join(missing)}")
 
     if not articles:
         console.print("[yellow]No valid articles found[/yellow]")
         raise typer.Exit(0)
 
-    # Import publisher
-    from autopaper.publishers.obsidian import ObsidianPublisher
-
     console.print("[cyan]Syncing to Obsidian...[/cyan]")
 
     publisher = ObsidianPublisher(
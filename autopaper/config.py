@@ -1,42 +1,49 @@
 """Configuration management for AutoPaper."""
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Mapping, Optional, Sequence, Set, Tuple, Union
 
-import yaml
-from dotenv import load_dotenv
+from autopaper.utils.yaml_loader import load_yaml_file
+
+# Files that mark the project root
+_PROJECT_MARKERS = ("config.yaml", "pyproject.toml")
+
+# (path, mtime_ns) of the .env file last applied to os.environ
+_DOTENV_KEY: Optional[Tuple[str, int]] = None
+
+# Directories already created by ensure_directories() in this process
+_ENSURED_DIRS: Set[str] = set()
+
+
+def ensure_dir(path: Union[str, os.PathLike]):
+    """Create a directory (and parents) unless it was already ensured.
+
+    Each path is checked at most once per process, with a single stat when
+    it already exists.
+
+    Args:
+        path: Directory path
+    """
+    path = os.fspath(path)
+    if path in _ENSURED_DIRS:
+        return
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
+    _ENSURED_DIRS.add(path)
 
 
 def find_project_root() -> Path:
     """Find the project root directory by searching for config.yaml.
 
     Searches upward from current directory until config.yaml is found.
-    If not found, returns current directory.
+    If not found, returns current directory. The result is cached per
+    working directory and AUTOPAPER_CONFIG_PATH value.
 
     Returns:
         Path to project root directory
     """
-    current = Path.cwd()
-
-    # Check if config path is explicitly set via environment variable
-    explicit_path = os.getenv("AUTOPAPER_CONFIG_PATH")
-    if explicit_path:
-        explicit_config = Path(explicit_path)
-        if explicit_config.is_absolute():
-            return explicit_config.parent
-        return current / explicit_config.parent
-
-    # Search upward for config.yaml
-    while current != current.parent:
-        if (current / "config.yaml").exists():
-            return current
-        # Also check for pyproject.toml as a project marker
-        if (current / "pyproject.toml").exists():
-            return current
-        current = current.parent
-
-    # Fallback to current directory
-    return Path.cwd()
+    return _resolve_paths(os.getcwd(), os.getenv("AUTOPAPER_CONFIG_PATH"))[0]
 
 
 def get_default_config_path() -> str:
@@ -49,20 +56,74 @@ def get_default_config_path() -> str:
     Returns:
         Path to config file as string
     """
-    # Check environment variable first
-    explicit_path = os.getenv("AUTOPAPER_CONFIG_PATH")
+    return _resolve_paths(os.getcwd(), os.getenv("AUTOPAPER_CONFIG_PATH"))[1]
+
+
+@lru_cache(maxsize=8)
+def _resolve_paths(cwd: str, explicit_path: Optional[str]) -> Tuple[Path, str]:
+    """Locate the project root and default config file from a working directory.
+
+    Args:
+        cwd: Working directory to start from
+        explicit_path: Value of AUTOPAPER_CONFIG_PATH, if set
+
+    Returns:
+        Tuple of (project root, config file path)
+    """
+    current = Path(cwd)
+
+    # Check if config path is explicitly set via environment variable
     if explicit_path:
-        return explicit_path
+        explicit_config = Path(explicit_path)
+        if explicit_config.is_absolute():
+            return explicit_config.parent, explicit_path
+        return current / explicit_config.parent, explicit_path
 
-    # Find project root and check for config.yaml
-    project_root = find_project_root()
-    config_path = project_root / "config.yaml"
+    project_root = Path(cwd)
 
+    # Search upward for config.yaml (or pyproject.toml as a project marker),
+    # reading each directory once instead of stat-ing both names
+    while current != current.parent:
+        try:
+            with os.scandir(current) as entries:
+                if any(entry.name in _PROJECT_MARKERS for entry in entries):
+                    project_root = current
+                    break
+        except OSError:
+            # Unreadable directory: fall back to checking the markers directly
+            if any((current / marker).exists() for marker in _PROJECT_MARKERS):
+                project_root = current
+                break
+        current = current.parent
+
+    # Use config.yaml in the project root, falling back to the current directory
+    config_path = project_root / "config.yaml"
     if config_path.exists():
-        return str(config_path)
+        return project_root, str(config_path)
+    return project_root, "config.yaml"
+
+
+def _load_dotenv():
+    """Apply the .env file to os.environ unless it is unchanged since last applied.
+
+    override=True ensures .env values take precedence over shell env vars.
+    """
+    global _DOTENV_KEY
+    from dotenv import find_dotenv, load_dotenv
 
-    # Fallback to default
-    return "config.yaml"
+    dotenv_path = find_dotenv()
+    if not dotenv_path:
+        return
+
+    try:
+        key = (dotenv_path, os.stat(dotenv_path).st_mtime_ns)
+    except OSError:
+        return
+    if key == _DOTENV_KEY:
+        return
+
+    load_dotenv(dotenv_path, override=True)
+    _DOTENV_KEY = key
 
 
 class Config:
@@ -75,24 +136,65 @@ class Config:
             config_path: Path to configuration file. If None, uses get_default_config_path()
         """
         # Load environment variables from .env file
-        # override=True ensures .env values take precedence over shell env vars
-        load_dotenv(override=True)
+        _load_dotenv()
 
         if config_path is None:
             config_path = get_default_config_path()
 
         self.config_path = Path(config_path)
-        self.config: Dict[str, Any] = {}
+        self.config: Mapping[str, Any] = {}
+        self._flat: Dict[str, Any] = {}
+        self._paths: Dict[str, str] = {}
+        self._env: Dict[str, Optional[str]] = {}
+        self._smtp_port: Optional[int] = None
         self._load_config()
 
     def _load_config(self):
         """Load configuration from YAML file."""
-        if self.config_path.exists():
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                self.config = yaml.safe_load(f) or {}
-        else:
+        try:
+            self.config = load_yaml_file(self.config_path)
+        except FileNotFoundError:
             self.config = {}
 
+        self.reload_env()
+
+    def _flatten(self, node: Mapping[str, Any], prefix: str):
+        """Index every value of a config section under its dotted key.
+
+        Environment variable references (``${VAR}``) are resolved here once,
+        so lookups in get() are a single dict hit.
+
+        Args:
+            node: Configuration section to index
+            prefix: Dotted key of the section ("" for the top level)
+        """
+        for k, value in node.items():
+            key = f"{prefix}{k}"
+
+            # Substitute environment variables
+            if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
+                value = self._getenv(value[2:-1], None)
+
+            self._flat[key] = value
+            if isinstance(value, Mapping):
+                self._flatten(value, key + ".")
+
+    def reload(self):
+        """Reload the configuration file and re-resolve environment variables."""
+        self._load_config()
+
+    def reload_env(self):
+        """Re-read environment variables without reloading the configuration file.
+
+        Useful when os.environ changes after the configuration was loaded
+        (e.g., in tests).
+        """
+        self._env = {}
+        self._smtp_port = None
+        self._flat = {}
+        self._paths = {}
+        self._flatten(self.config, "")
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by key.
 
@@ -103,24 +205,39 @@ class Config:
         Returns:
             Configuration value or default
         """
-        keys = key.split(".")
-        value = self.config
+        value = self._flat.get(key)
+        return default if value is None else value
 
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                return default
+    def _getenv(self, name: str, default: Optional[str] = "") -> Optional[str]:
+        """Get an environment variable, cached until the configuration is reloaded.
 
-            # Substitute environment variables
-            if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-                env_var = value[2:-1]
-                value = os.getenv(env_var, default)
+        Args:
+            name: Environment variable name
+            default: Default value if the variable is not set
+
+        Returns:
+            Variable value or default
+        """
+        # Cache the raw value so each caller's default is applied on return
+        value = self._env[name] if name in self._env else self._env.setdefault(name, os.environ.get(name))
+        return default if value is None else value
 
-            if value is None:
-                return default
+    def _get_path(self, key: str, default: str) -> str:
+        """Get a path value with ~ expanded to the home directory.
 
-        return value
+        The expanded path is cached until the configuration is reloaded.
+
+        Args:
+            key: Configuration key
+            default: Default path if key not found
+
+        Returns:
+            Expanded path
+        """
+        path = self._paths.get(key)
+        if path is None:
+            path = self._paths[key] = os.path.expanduser(self.get(key, default))
+        return path
 
     def get_database_path(self) -> str:
         """Get database path.
@@ -128,9 +245,7 @@ class Config:
         Returns:
             Path to SQLite database
         """
-        path = self.get("database_path", "data/db.sqlite")
-        # Expand ~ to home directory
-        return os.path.expanduser(path)
+        return self._get_path("database_path", "data/db.sqlite")
 
     def get_obsidian_vault_path(self) -> str:
         """Get Obsidian vault path.
@@ -138,9 +253,7 @@ class Config:
         Returns:
             Path to Obsidian vault
         """
-        path = self.get("obsidian.vault_path", "")
-        # Expand ~ to home directory
-        return os.path.expanduser(path)
+        return self._get_path("obsidian.vault_path", "")
 
     def get_obsidian_auto_paper_folder(self) -> str:
         """Get AutoPaper folder name in Obsidian vault.
@@ -196,7 +309,7 @@ class Config:
         Returns:
             Anthropic API key from environment (supports ANTHROPIC_API_KEY or ANTHROPIC_AUTH_TOKEN)
         """
-        return os.getenv("ANTHROPIC_API_KEY") or os.getenv("ANTHROPIC_AUTH_TOKEN", "")
+        return self._getenv("ANTHROPIC_API_KEY") or self._getenv("ANTHROPIC_AUTH_TOKEN")
 
     def get_anthropic_base_url(self) -> str:
         """Get Anthropic API base URL.
@@ -204,7 +317,7 @@ class Config:
         Returns:
             Custom base URL from environment (e.g., for proxy), or default
         """
-        return os.getenv("ANTHROPIC_BASE_URL", "")
+        return self._getenv("ANTHROPIC_BASE_URL")
 
     def get_anthropic_model(self) -> str:
         """Get default Anthropic model.
@@ -212,7 +325,7 @@ class Config:
         Returns:
             Model name from ANTHROPIC_MODEL environment variable
         """
-        return os.getenv("ANTHROPIC_MODEL", "")
+        return self._getenv("ANTHROPIC_MODEL")
 
     def get_anthropic_sonnet_model(self) -> str:
         """Get Anthropic Sonnet model.
@@ -220,7 +333,7 @@ class Config:
         Returns:
             Sonnet model name from ANTHROPIC_DEFAULT_SONNET_MODEL environment variable
         """
-        return os.getenv("ANTHROPIC_DEFAULT_SONNET_MODEL", "")
+        return self._getenv("ANTHROPIC_DEFAULT_SONNET_MODEL")
 
     def get_anthropic_opus_model(self) -> str:
         """Get Anthropic Opus model.
@@ -228,7 +341,7 @@ class Config:
         Returns:
             Opus model name from ANTHROPIC_DEFAULT_OPUS_MODEL environment variable
         """
-        return os.getenv("ANTHROPIC_DEFAULT_OPUS_MODEL", "")
+        return self._getenv("ANTHROPIC_DEFAULT_OPUS_MODEL")
 
     def get_anthropic_haiku_model(self) -> str:
         """Get Anthropic Haiku model.
@@ -236,7 +349,7 @@ class Config:
         Returns:
             Haiku model name from ANTHROPIC_DEFAULT_HAIKU_MODEL environment variable
         """
-        return os.getenv("ANTHROPIC_DEFAULT_HAIKU_MODEL", "")
+        return self._getenv("ANTHROPIC_DEFAULT_HAIKU_MODEL")
 
     def get_model(self) -> str:
         """Get Claude model to use.
@@ -254,19 +367,19 @@ class Config:
         """
         return self.get("api.max_tokens", 4096)
 
-    def get_tag_normalization_rules(self) -> Dict[str, List[str]]:
+    def get_tag_normalization_rules(self) -> Mapping[str, Sequence[str]]:
         """Get tag normalization rules.
 
         Returns:
-            Dictionary mapping normalized tags to their variants
+            Read-only mapping of normalized tags to their variants
         """
         return self.get("tag_normalization", {})
 
-    def get_pdf_config(self) -> Dict[str, Any]:
+    def get_pdf_config(self) -> Mapping[str, Any]:
         """Get PDF export configuration.
 
         Returns:
-            PDF configuration dictionary
+            Read-only PDF configuration mapping
         """
         return self.get("pdf", {})
 
@@ -276,7 +389,7 @@ class Config:
         Returns:
             SMTP host address
         """
-        return os.getenv("SMTP_HOST", "")
+        return self._getenv("SMTP_HOST")
 
     def get_smtp_port(self) -> int:
         """Get SMTP port.
@@ -284,11 +397,12 @@ class Config:
         Returns:
             SMTP port number
         """
-        port = os.getenv("SMTP_PORT", "587")
-        try:
-            return int(port)
-        except ValueError:
-            return 587
+        if self._smtp_port is None:
+            try:
+                self._smtp_port = int(self._getenv("SMTP_PORT", "587"))
+            except ValueError:
+                self._smtp_port = 587
+        return self._smtp_port
 
     def get_smtp_username(self) -> str:
         """Get SMTP username.
@@ -296,7 +410,7 @@ class Config:
         Returns:
             SMTP username (usually email address)
         """
-        return os.getenv("EMAIL_USERNAME", "")
+        return self._getenv("EMAIL_USERNAME")
 
     def get_smtp_password(self) -> str:
         """Get SMTP password.
@@ -304,7 +418,7 @@ class Config:
         Returns:
             SMTP password or app-specific password
         """
-        return os.getenv("EMAIL_PASSWORD", "")
+        return self._getenv("EMAIL_PASSWORD")
 
     def get_email_from(self) -> str:
         """Get sender email address.
@@ -312,7 +426,7 @@ class Config:
         Returns:
             Sender email address (e.g., "AutoPaper <email@example.com>")
         """
-        return os.getenv("EMAIL_FROM", "")
+        return self._getenv("EMAIL_FROM")
 
     def get_email_config(self) -> Dict[str, Any]:
         """Get complete email configuration.
@@ -336,12 +450,30 @@ class Config:
             self.get_articles_enriched_dir(),
             self.get_articles_images_dir(),
             self.get_issues_dir(),
-            Path(self.get_database_path()).parent,
+            os.path.dirname(self.get_database_path()) or ".",
         ]
 
         for dir_path in dirs:
-            Path(dir_path).mkdir(parents=True, exist_ok=True)
+            ensure_dir(dir_path)
+
+
+_config: Optional[Config] = None
+
+
+def get_config() -> Config:
+    """Get the global configuration, loading it on first use.
+
+    Returns:
+        Shared Config instance
+    """
+    global _config
+    if _config is None:
+        _config = Config()
+    return _config
 
 
-# Global configuration instance
-config = Config()
+def __getattr__(name: str) -> Any:
+    """Load the global ``config`` instance lazily on first attribute access."""
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
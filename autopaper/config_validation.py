@@ -1,158 +1,225 @@
-"""Configuration validation using Pydantic."""
+"""Configuration validation using dataclasses."""
 import os
-from pathlib import Path
-from typing import Optional, List
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from autopaper.config import ensure_dir
+
+VALID_JOURNAL_MODES = ['DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF']
+VALID_SYNCHRONOUS = ['OFF', 'NORMAL', 'FULL', 'EXTRA']
+VALID_MODELS = [
+    "claude-sonnet-4-5-20250929",
+    "claude-opus-4-5-20251101",
+]
+VALID_LOG_LEVELS = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+
+
+def _known_fields(cls, data: Mapping[str, Any]) -> Dict[str, Any]:
+    """Keep only the keys that are fields of a config dataclass.
+
+    Args:
+        cls: Config dataclass
+        data: Raw section from YAML
+
+    Returns:
+        Keyword arguments for cls (unknown keys are ignored)
+    """
+    names = {f.name for f in fields(cls)}
+    return {k: v for k, v in data.items() if k in names}
+
+
+def _check_choice(name: str, value: str, choices: List[str]) -> str:
+    """Normalize a value to upper case and check it against allowed choices.
+
+    Args:
+        name: Field name (for the error message)
+        value: Value to check
+        choices: Allowed upper-case values
+
+    Returns:
+        Upper-cased value
+
+    Raises:
+        ValueError: If the value is not allowed
+    """
+    # YAML reads unquoted on/off/yes/no as booleans
+    if not isinstance(value, str):
+        raise ValueError(f"Invalid {name}: {value!r}. Must be one of {choices} (quote it in YAML)")
+    value = value.upper()
+    if value not in choices:
+        raise ValueError(f"Invalid {name}: {value}. Must be one of {choices}")
+    return value
+
+
+def _check_range(name: str, value: Any, ge: Optional[int] = None, le: Optional[int] = None) -> int:
+    """Convert a value to int and check its bounds.
+
+    Args:
+        name: Field name (for the error message)
+        value: Value to check
+        ge: Minimum allowed value
+        le: Maximum allowed value
+
+    Returns:
+        Integer value
+
+    Raises:
+        ValueError: If the value is not an integer or out of range
+    """
+    value = int(value)
+    if ge is not None and value < ge:
+        raise ValueError(f"Invalid {name}: {value}. Must be >= {ge}")
+    if le is not None and value > le:
+        raise ValueError(f"Invalid {name}: {value}. Must be <= {le}")
+    return value
+
+
+@dataclass(slots=True)
+class DatabaseConfig:
+    """Database configuration."""
+    path: str = "data/db.sqlite"  # Path to SQLite database
+    journal_mode: str = "WAL"  # SQLite journal mode
+    synchronous: str = "NORMAL"  # SQLite synchronous setting
 
-from pydantic import BaseModel, Field, validator, root_validator
+    def __post_init__(self):
+        self.journal_mode = _check_choice("journal_mode", self.journal_mode, VALID_JOURNAL_MODES)
+        self.synchronous = _check_choice("synchronous", self.synchronous, VALID_SYNCHRONOUS)
 
 
-class DatabaseConfig(BaseModel):
-    """Database configuration."""
-    path: str = Field(default="data/db.sqlite", description="Path to SQLite database")
-    journal_mode: str = Field(default="WAL", description="SQLite journal mode")
-    synchronous: str = Field(default="NORMAL", description="SQLite synchronous setting")
-
-    @validator('journal_mode')
-    def validate_journal_mode(cls, v):
-        valid_modes = ['DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF']
-        v = v.upper()
-        if v not in valid_modes:
-            raise ValueError(f"Invalid journal_mode: {v}. Must be one of {valid_modes}")
-        return v
-
-    @validator('synchronous')
-    def validate_synchronous(cls, v):
-        valid_values = ['OFF', 'NORMAL', 'FULL', 'EXTRA']
-        v = v.upper()
-        if v not in valid_values:
-            raise ValueError(f"Invalid synchronous: {v}. Must be one of {valid_values}")
-        return v
-
-
-class ObsidianConfig(BaseModel):
+@dataclass(slots=True)
+class ObsidianConfig:
     """Obsidian integration configuration."""
-    vault_path: str = Field(..., description="Path to Obsidian vault")
-    auto_paper_folder: str = Field(default="AutoPaper", description="Folder name in vault")
-    create_folders: bool = Field(default=True, description="Auto-create folders if missing")
+    vault_path: str  # Path to Obsidian vault
+    auto_paper_folder: str = "AutoPaper"  # Folder name in vault
+    create_folders: bool = True  # Auto-create folders if missing
+
+    def __post_init__(self):
+        self.vault_path = os.path.expanduser(self.vault_path)
 
-    @validator('vault_path')
-    def validate_vault_path(cls, v):
-        path = Path(v).expanduser()
-        if not path.exists():
-            raise ValueError(f"Obsidian vault does not exist: {v}")
-        if not path.is_dir():
-            raise ValueError(f"Obsidian vault path is not a directory: {v}")
-        return str(path)
+    def ensure_valid(self):
+        """Check that the vault exists (done on first use, not at load time).
 
+        Raises:
+            ValueError: If the vault does not exist or is not a directory
+        """
+        if not os.path.exists(self.vault_path):
+            raise ValueError(f"Obsidian vault does not exist: {self.vault_path}")
+        if not os.path.isdir(self.vault_path):
+            raise ValueError(f"Obsidian vault path is not a directory: {self.vault_path}")
 
-class ArticleStorageConfig(BaseModel):
+
+@dataclass(slots=True)
+class ArticleStorageConfig:
     """Article storage configuration."""
-    raw_dir: str = Field(default="articles/raw", description="Raw HTML storage")
-    parsed_dir: str = Field(default="articles/parsed", description="Parsed JSON storage")
-    enriched_dir: str = Field(default="articles/enriched", description="AI-enriched metadata storage")
-    images_dir: str = Field(default="articles/images", description="Downloaded images storage")
+    raw_dir: str = "articles/raw"  # Raw HTML storage
+    parsed_dir: str = "articles/parsed"  # Parsed JSON storage
+    enriched_dir: str = "articles/enriched"  # AI-enriched metadata storage
+    images_dir: str = "articles/images"  # Downloaded images storage
 
     def create_directories(self):
         """Create all storage directories."""
-        for field in ['raw_dir', 'parsed_dir', 'enriched_dir', 'images_dir']:
-            path = Path(getattr(self, field))
-            path.mkdir(parents=True, exist_ok=True)
+        for field_name in ['raw_dir', 'parsed_dir', 'enriched_dir', 'images_dir']:
+            ensure_dir(getattr(self, field_name))
 
 
-class IssuesConfig(BaseModel):
+@dataclass(slots=True)
+class IssuesConfig:
     """Issues (newspaper) storage configuration."""
-    output_dir: str = Field(default="issues", description="Generated issues storage")
-    pdf_dir: str = Field(default="issues", description="PDF export directory")
+    output_dir: str = "issues"  # Generated issues storage
+    pdf_dir: str = "issues"  # PDF export directory
 
     def create_directories(self):
         """Create all storage directories."""
-        for field in ['output_dir', 'pdf_dir']:
-            path = Path(getattr(self, field))
-            path.mkdir(parents=True, exist_ok=True)
+        for field_name in ['output_dir', 'pdf_dir']:
+            ensure_dir(getattr(self, field_name))
 
 
-class CacheConfig(BaseModel):
+@dataclass(slots=True)
+class CacheConfig:
     """Caching configuration."""
-    enabled: bool = Field(default=True, description="Enable caching")
-    cache_dir: str = Field(default="cache", description="Cache directory")
-    ai_metadata_ttl: int = Field(default=604800, description="AI metadata cache TTL (seconds, default 7 days)")
-    default_ttl: int = Field(default=86400, description="Default cache TTL (seconds, default 24 hours)")
-
-    @validator('cache_dir')
-    def validate_cache_dir(cls, v):
-        Path(v).mkdir(parents=True, exist_ok=True)
-        return v
+    enabled: bool = True  # Enable caching
+    cache_dir: str = "cache"  # Cache directory
+    ai_metadata_ttl: int = 604800  # AI metadata cache TTL (seconds, default 7 days)
+    default_ttl: int = 86400  # Default cache TTL (seconds, default 24 hours)
 
 
-class AIConfig(BaseModel):
+@dataclass(slots=True)
+class AIConfig:
     """AI API configuration."""
-    model: str = Field(
-        default="claude-sonnet-4-5-20250929",
-        description="Claude model to use"
-    )
-    max_tokens: int = Field(default=4096, ge=1, le=200000, description="Maximum tokens per request")
-    timeout: int = Field(default=120, ge=1, description="Request timeout in seconds")
-
-    @validator('model')
-    def validate_model(cls, v):
-        valid_models = [
-            "claude-sonnet-4-5-20250929",
-            "claude-opus-4-5-20251101",
-        ]
-        if v not in valid_models:
-            raise ValueError(
-                f"Invalid model: {v}. Must be one of {valid_models}"
-            )
-        return v
-
-
-class LoggingConfig(BaseModel):
+    model: str = "claude-sonnet-4-5-20250929"  # Claude model to use
+    max_tokens: int = 4096  # Maximum tokens per request
+    timeout: int = 120  # Request timeout in seconds
+
+    def __post_init__(self):
+        if self.model not in VALID_MODELS:
+            raise ValueError(f"Invalid model: {self.model}. Must be one of {VALID_MODELS}")
+        self.max_tokens = _check_range("max_tokens", self.max_tokens, ge=1, le=200000)
+        self.timeout = _check_range("timeout", self.timeout, ge=1)
+
+
+@dataclass(slots=True)
+class LoggingConfig:
     """Logging configuration."""
-    enabled: bool = Field(default=True, description="Enable logging")
-    log_file: str = Field(default="data/autopaper.log", description="Log file path")
-    log_level: str = Field(default="INFO", description="Logging level")
-    console_level: str = Field(default="WARNING", description="Console logging level")
+    enabled: bool = True  # Enable logging
+    log_file: str = "data/autopaper.log"  # Log file path
+    log_level: str = "INFO"  # Logging level
+    console_level: str = "WARNING"  # Console logging level
 
-    @validator('log_level', 'console_level')
-    def validate_log_level(cls, v):
-        valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        v = v.upper()
-        if v not in valid_levels:
-            raise ValueError(f"Invalid log level: {v}. Must be one of {valid_levels}")
-        return v
+    def __post_init__(self):
+        self.log_level = _check_choice("log level", self.log_level, VALID_LOG_LEVELS)
+        self.console_level = _check_choice("log level", self.console_level, VALID_LOG_LEVELS)
 
 
-class PerformanceConfig(BaseModel):
+@dataclass(slots=True)
+class PerformanceConfig:
     """Performance tuning configuration."""
-    enable_profiling: bool = Field(default=False, description="Enable performance profiling")
-    max_concurrent_downloads: int = Field(default=5, ge=1, le=20, description="Max concurrent image downloads")
-    connection_pool_size: int = Field(default=10, ge=1, description="Database connection pool size")
+    enable_profiling: bool = False  # Enable performance profiling
+    max_concurrent_downloads: int = 5  # Max concurrent image downloads
+    connection_pool_size: int = 10  # Database connection pool size
+
+    def __post_init__(self):
+        self.max_concurrent_downloads = _check_range(
+            "max_concurrent_downloads", self.max_concurrent_downloads, ge=1, le=20
+        )
+        self.connection_pool_size = _check_range("connection_pool_size", self.connection_pool_size, ge=1)
+
+
+# Section name -> dataclass, used to build nested sections from YAML dicts
+_SECTIONS = {
+    "database": DatabaseConfig,
+    "obsidian": ObsidianConfig,
+    "article_storage": ArticleStorageConfig,
+    "issues": IssuesConfig,
+    "cache": CacheConfig,
+    "ai": AIConfig,
+    "logging": LoggingConfig,
+    "performance": PerformanceConfig,
+}
 
 
-class Config(BaseModel):
+# Validated configs keyed by (class, YAML path), with the document they were built from
+_VALIDATED_CONFIGS: Dict[Tuple[type, str], Tuple[Mapping[str, Any], "Config"]] = {}
+
+
+@dataclass(slots=True)
+class Config:
     """Main configuration model with validation."""
 
-    database: DatabaseConfig = Field(default_factory=DatabaseConfig)
+    database: DatabaseConfig = field(default_factory=DatabaseConfig)
     obsidian: Optional[ObsidianConfig] = None
-    article_storage: ArticleStorageConfig = Field(default_factory=ArticleStorageConfig)
-    issues: IssuesConfig = Field(default_factory=IssuesConfig)
-    cache: CacheConfig = Field(default_factory=CacheConfig)
-    ai: AIConfig = Field(default_factory=AIConfig)
-    logging: LoggingConfig = Field(default_factory=LoggingConfig)
-    performance: PerformanceConfig = Field(default_factory=PerformanceConfig)
-
-    @root_validator(skip_on_failure=True)
-    def validate_environment(cls, values):
-        """Validate environment variables."""
-        # Only check if ANTHROPIC_API_KEY is set when creating config
-        # Skip validation if not provided (allow for testing)
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if api_key is None:
-            # Allow creation without API key for testing purposes
-            # The actual API calls will fail later
-            pass
-
-        return values
+    article_storage: ArticleStorageConfig = field(default_factory=ArticleStorageConfig)
+    issues: IssuesConfig = field(default_factory=IssuesConfig)
+    cache: CacheConfig = field(default_factory=CacheConfig)
+    ai: AIConfig = field(default_factory=AIConfig)
+    logging: LoggingConfig = field(default_factory=LoggingConfig)
+    performance: PerformanceConfig = field(default_factory=PerformanceConfig)
+
+    def __post_init__(self):
+        # Build section objects from plain dicts (as loaded from YAML)
+        for name, section_cls in _SECTIONS.items():
+            value = getattr(self, name)
+            if isinstance(value, Mapping):
+                setattr(self, name, section_cls(**_known_fields(section_cls, value)))
 
     @classmethod
     def from_yaml(cls, yaml_path: str = "config.yaml") -> 'Config':
@@ -162,32 +229,39 @@ class Config(BaseModel):
             yaml_path: Path to YAML config file
 
         Returns:
-            Validated Config object
+            Validated Config object (shared while the file is unchanged, so
+            treat it as read-only)
 
         Raises:
-            FileNotFoundError: If config file doesn't exist
-            ValidationError: If config is invalid
+            ValueError: If config is invalid
         """
-        import yaml
+        from autopaper.utils.yaml_loader import load_yaml_file
 
-        config_file = Path(yaml_path)
-        if not config_file.exists():
+        try:
+            data = load_yaml_file(yaml_path)
+        except FileNotFoundError:
             # Return default config if file doesn't exist
             return cls()
 
-        with open(config_file, 'r') as f:
-            data = yaml.safe_load(f) or {}
+        # load_yaml_file returns the same document object while the file is
+        # unchanged, so the config validated from it can be reused as is
+        cache_key = (cls, str(yaml_path))
+        cached = _VALIDATED_CONFIGS.get(cache_key)
+        if cached is not None and cached[0] is data:
+            return cached[1]
 
-        return cls(**data)
+        config = cls(**_known_fields(cls, data))
+        _VALIDATED_CONFIGS[cache_key] = (data, config)
+        return config
 
     def create_directories(self):
         """Create all required directories."""
         self.article_storage.create_directories()
         self.issues.create_directories()
         if self.cache.enabled:
-            Path(self.cache.cache_dir).mkdir(parents=True, exist_ok=True)
-        Path(self.database.path).parent.mkdir(parents=True, exist_ok=True)
-        Path(self.logging.log_file).parent.mkdir(parents=True, exist_ok=True)
+            ensure_dir(self.cache.cache_dir)
+        ensure_dir(os.path.dirname(self.database.path) or ".")
+        ensure_dir(os.path.dirname(self.logging.log_file) or ".")
 
 
 # Legacy compatibility - keep the old Config class working
@@ -218,6 +292,7 @@ class _LegacyConfig:
 
     def get_obsidian_vault_path(self) -> str:
         if self._config.obsidian:
+            self._config.obsidian.ensure_valid()
             return self._config.obsidian.vault_path
         raise ValueError("Obsidian config not set")
 
@@ -227,5 +302,14 @@ class _LegacyConfig:
         raise ValueError("Obsidian config not set")
 
 
-# Create global config instance
-config = _LegacyConfig()
+_legacy_config: Optional[_LegacyConfig] = None
+
+
+def __getattr__(name: str) -> Any:
+    """Create the global ``config`` instance lazily on first attribute access."""
+    global _legacy_config
+    if name == "config":
+        if _legacy_config is None:
+            _legacy_config = _LegacyConfig()
+        return _legacy_config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,92 +1,376 @@
 """Database connection and operations management."""
+import atexit
+import json
 import os
+import queue
 import sqlite3
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Iterator, List, Optional, Tuple
 
-from autopaper.models import Article, Issue
+from autopaper.models import Article, ArticleSummary, Issue
 from autopaper.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Applied once to every connection as it is opened: WAL lets readers run
+# alongside the writer, NORMAL sync drops most fsyncs (safe under WAL) and
+# a 64MB page cache keeps recently used rows in memory
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA foreign_keys=ON",
+)
+
+# Bump when _SCHEMA_SQL or the migrations in Database._init_db change
+_SCHEMA_VERSION = 1
+
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT UNIQUE NOT NULL,
+    title TEXT,
+    author TEXT,
+    source TEXT,
+    publish_date TEXT,
+    added_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    summary TEXT,
+    tags TEXT,
+    article_type TEXT,
+    key_points TEXT,
+    content TEXT,
+    slug TEXT,
+    cover_image TEXT
+);
+
+-- Tags and key points, one row each (the JSON columns above are still
+-- written so older versions can read the database)
+CREATE TABLE IF NOT EXISTS article_tags (
+    article_id INTEGER NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+    tag TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS article_key_points (
+    article_id INTEGER NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+    idx INTEGER NOT NULL,
+    point TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS issues (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    slug TEXT UNIQUE NOT NULL,
+    issue_type TEXT NOT NULL,
+    start_date TEXT,
+    end_date TEXT,
+    content TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_articles_slug ON articles(slug);
+CREATE INDEX IF NOT EXISTS idx_articles_added_date ON articles(added_date DESC);
+CREATE INDEX IF NOT EXISTS idx_article_tags_tag ON article_tags(tag);
+CREATE INDEX IF NOT EXISTS idx_article_tags_article ON article_tags(article_id);
+CREATE INDEX IF NOT EXISTS idx_article_key_points_article ON article_key_points(article_id);
+CREATE INDEX IF NOT EXISTS idx_issues_slug ON issues(slug);
+
+-- Filter + newest-first listings read these in order, so LIMIT stops early
+-- and no sort is needed. They also serve plain type lookups, which makes the
+-- old single-column type indexes redundant.
+CREATE INDEX IF NOT EXISTS idx_articles_type_date ON articles(article_type, added_date DESC);
+CREATE INDEX IF NOT EXISTS idx_issues_type_created ON issues(issue_type, created_at DESC);
+DROP INDEX IF EXISTS idx_articles_type;
+DROP INDEX IF EXISTS idx_issues_type;
+"""
+
+# Article statements are shared by every call so sqlite3's per-connection
+# statement cache (see _connect) reuses the prepared statement
+_SQL_INSERT_ARTICLE = """
+    INSERT INTO articles (
+        url, title, author, source, publish_date, added_date,
+        summary, tags, article_type, key_points, content, slug, cover_image
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_UPDATE_ARTICLE = """
+    UPDATE articles SET
+        title = ?, author = ?, source = ?, publish_date = ?,
+        summary = ?, tags = ?, article_type = ?, key_points = ?,
+        content = ?, slug = ?, cover_image = ?
+    WHERE id = ?
+"""
+_SQL_DELETE_ARTICLE = "DELETE FROM articles WHERE id = ?"
+
+# Columns in Article.from_row order. Tags and key points are read from the
+# article_tags / article_key_points tables, so their JSON columns (kept as a
+# fallback for older versions) are not selected or decoded
+_ARTICLE_COLUMNS = (
+    "id, url, title, author, source, publish_date, added_date, summary, "
+    "NULL, article_type, NULL, content, slug, cover_image"
+)
+_SQL_GET_ARTICLE_BY_ID = f"SELECT {_ARTICLE_COLUMNS} FROM articles WHERE id = ?"
+_SQL_GET_ARTICLE_BY_URL = f"SELECT {_ARTICLE_COLUMNS} FROM articles WHERE url = ?"
+_SQL_GET_ARTICLE_BY_SLUG = f"SELECT {_ARTICLE_COLUMNS} FROM articles WHERE slug = ?"
+_SQL_LIST_ARTICLES = f"SELECT {_ARTICLE_COLUMNS} FROM articles WHERE 1=1"
+_SQL_LIST_ARTICLE_SUMMARIES = (
+    "SELECT id, url, title, author, source, publish_date, added_date, article_type, slug, cover_image "
+    "FROM articles WHERE 1=1"
+)
+
+_SQL_INSERT_TAG = "INSERT INTO article_tags (article_id, tag) VALUES (?, ?)"
+_SQL_INSERT_KEY_POINT = "INSERT INTO article_key_points (article_id, idx, point) VALUES (?, ?, ?)"
+_SQL_DELETE_TAGS = "DELETE FROM article_tags WHERE article_id = ?"
+_SQL_DELETE_KEY_POINTS = "DELETE FROM article_key_points WHERE article_id = ?"
+
+# Rows fetched (and articles built) at a time by iter_articles
+_ITER_BATCH_SIZE = 100
+
+# Single-article lookups (by id, url or slug) kept in memory per Database
+_ARTICLE_CACHE_SIZE = 512
+
+# Keeps IN (...) lists below SQLite's bound-parameter limit on older builds
+_MAX_IN_PARAMS = 500
+
+
+def _copy_article(article: Optional[Article]) -> Optional[Article]:
+    """Copy a cached article so callers cannot modify the cached one.
+
+    Args:
+        article: Cached article or None
+
+    Returns:
+        Copy of the article (with its own lists) or None
+    """
+    if article is None:
+        return None
+    return replace(article, tags=list(article.tags), key_points=list(article.key_points))
+
 
 class Database:
     """Database manager for AutoPaper."""
 
-    def __init__(self, db_path: str = "data/db.sqlite"):
+    def __init__(self, db_path: str = "data/db.sqlite", pool_size: int = 4):
         """Initialize database manager.
 
         Args:
             db_path: Path to SQLite database file
+            pool_size: Number of idle read connections kept open
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # SQLite allows many readers but a single writer, so writes share one
+        # connection behind a lock while reads check connections out of a pool
+        self._write_conn: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.Lock()
+        self._read_conns: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=pool_size)
+        # Single-article lookups by (column, value), most recently used last
+        self._article_cache: "OrderedDict[Tuple[str, Any], Optional[Article]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0
         self._init_db()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection to the database file.
+
+        Returns:
+            SQLite connection usable from any thread
+        """
+        conn = sqlite3.connect(self.db_path, cached_statements=256, check_same_thread=False)
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
     @contextmanager
-    def get_connection(self):
-        """Get database connection with context manager."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+    def read(self):
+        """Check out a read connection from the pool.
+
+        Connections are opened on demand and returned to the pool afterwards,
+        so repeated queries skip reopening the database file.
+        """
+        try:
+            conn = self._read_conns.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+
         try:
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
         finally:
-            conn.close()
+            try:
+                self._read_conns.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    @contextmanager
+    def write(self):
+        """Get the write connection with context manager.
+
+        The connection is opened on first use and kept for the life of the
+        instance. Each ``with`` block holds the write lock and is committed
+        on success and rolled back on error.
+        """
+        with self._write_lock:
+            if self._write_conn is None:
+                self._write_conn = self._connect()
+
+            conn = self._write_conn
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def close(self):
+        """Close all pooled connections (reopened on next use)."""
+        with self._write_lock:
+            if self._write_conn is not None:
+                self._write_conn.close()
+                self._write_conn = None
+
+        while True:
+            try:
+                self._read_conns.get_nowait().close()
+            except queue.Empty:
+                break
 
     def _init_db(self):
-        """Initialize database schema."""
-        with self.get_connection() as conn:
-            # Articles table
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS articles (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    url TEXT UNIQUE NOT NULL,
-                    title TEXT,
-                    author TEXT,
-                    source TEXT,
-                    publish_date TEXT,
-                    added_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    summary TEXT,
-                    tags TEXT,
-                    article_type TEXT,
-                    key_points TEXT,
-                    content TEXT,
-                    slug TEXT,
-                    cover_image TEXT
-                )
-                """
-            )
+        """Initialize database schema.
 
-            # Issues table
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS issues (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    slug TEXT UNIQUE NOT NULL,
-                    issue_type TEXT NOT NULL,
-                    start_date TEXT,
-                    end_date TEXT,
-                    content TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        The DDL runs as one script and only when the stored schema version
+        is older than _SCHEMA_VERSION, so an up-to-date database costs a
+        single PRAGMA read per process.
+        """
+        with self.write() as conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+                return
+
+            tables = {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+            # executescript commits first, so BEGIN keeps the DDL and the
+            # migrations below in one transaction (committed by write())
+            conn.executescript("BEGIN;" + _SCHEMA_SQL)
+
+            # Databases created before cover images were stored lack this column
+            # table_info rows are (cid, name, type, notnull, dflt_value, pk)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(articles)")}
+            if "cover_image" not in columns:
+                conn.execute("ALTER TABLE articles ADD COLUMN cover_image TEXT")
+
+            # Fill the tag and key point tables from the JSON columns of existing articles
+            if "article_tags" not in tables:
+                conn.execute(
+                    """
+                    INSERT INTO article_tags (article_id, tag)
+                    SELECT a.id, t.value
+                    FROM articles a,
+                         json_each(CASE WHEN json_valid(a.tags) THEN a.tags ELSE '[]' END) t
+                    ORDER BY a.id, t.key
+                    """
+                )
+            if "article_key_points" not in tables:
+                conn.execute(
+                    """
+                    INSERT INTO article_key_points (article_id, idx, point)
+                    SELECT a.id, k.key, k.value
+                    FROM articles a,
+                         json_each(CASE WHEN json_valid(a.key_points) THEN a.key_points ELSE '[]' END) k
+                    """
                 )
-                """
-            )
 
-            # Create indexes for better query performance
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_slug ON articles(slug)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_type ON articles(article_type)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_issues_slug ON issues(slug)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_issues_type ON issues(issue_type)")
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
 
     # Article operations
 
+    @staticmethod
+    def _article_insert_params(article: Article) -> tuple:
+        """Build the INSERT parameters for an article.
+
+        Args:
+            article: Article object to store
+
+        Returns:
+            Parameter tuple matching the articles INSERT statement
+        """
+        return (
+            article.url,
+            article.title,
+            article.author,
+            article.source,
+            article.publish_date,
+            article.added_date.isoformat() if article.added_date else datetime.now().isoformat(),
+            article.summary,
+            json.dumps(article.tags) if article.tags else "[]",
+            article.article_type,
+            json.dumps(article.key_points) if article.key_points else "[]",
+            article.content,
+            article.slug,
+            article.cover_image,
+        )
+
+    @staticmethod
+    def _insert_article_children(conn: sqlite3.Connection, articles: List[Article]):
+        """Store the tags and key points of articles that have IDs.
+
+        Args:
+            conn: Write connection (inside the caller's transaction)
+            articles: Articles whose tags and key points to insert
+        """
+        conn.executemany(_SQL_INSERT_TAG, [(a.id, tag) for a in articles for tag in a.tags])
+        conn.executemany(
+            _SQL_INSERT_KEY_POINT,
+            [(a.id, idx, point) for a in articles for idx, point in enumerate(a.key_points)],
+        )
+
+    @staticmethod
+    def _attach_children(conn: sqlite3.Connection, items: list, key_points: bool = True):
+        """Attach tags (and optionally key points) to articles or summaries.
+
+        Each table is queried once per batch of IDs rather than once per
+        article.
+
+        Args:
+            conn: Connection the items were read from
+            items: Article or ArticleSummary objects with empty child lists
+            key_points: Also attach key points (Article only)
+        """
+        by_id = {item.id: item for item in items}
+        ids = list(by_id)
+
+        for start in range(0, len(ids), _MAX_IN_PARAMS):
+            chunk = ids[start:start + _MAX_IN_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            for article_id, tag in conn.execute(
+                f"SELECT article_id, tag FROM article_tags WHERE article_id IN ({placeholders}) ORDER BY rowid",
+                chunk,
+            ):
+                by_id[article_id].tags.append(tag)
+            if not key_points:
+                continue
+            for article_id, point in conn.execute(
+                f"SELECT article_id, point FROM article_key_points WHERE article_id IN ({placeholders}) "
+                "ORDER BY article_id, idx",
+                chunk,
+            ):
+                by_id[article_id].key_points.append(point)
+
+    def _load_articles(self, conn: sqlite3.Connection, rows: List[tuple]) -> List[Article]:
+        """Build articles from rows and attach their tags and key points.
+
+        Args:
+            conn: Connection the rows were read from
+            rows: Rows selected with _ARTICLE_COLUMNS
+
+        Returns:
+            List of Article objects in row order
+        """
+        articles = [Article.from_row(row) for row in rows]
+        self._attach_children(conn, articles)
+        return articles
+
     def add_article(self, article: Article) -> Article:
         """Add a new article to the database.
 
@@ -96,52 +380,104 @@ class Database:
         Returns:
             Article with assigned ID
         """
-        import json
-
         logger.debug(f"Adding article: {article.slug} - {article.title[:50]}")
 
         try:
-            with self.get_connection() as conn:
-                cursor = conn.execute(
-                    """
-                    INSERT INTO articles (
-                        url, title, author, source, publish_date, added_date,
-                        summary, tags, article_type, key_points, content, slug, cover_image
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        article.url,
-                        article.title,
-                        article.author,
-                        article.source,
-                        article.publish_date,
-                        article.added_date.isoformat() if article.added_date else datetime.now().isoformat(),
-                        article.summary,
-                        json.dumps(article.tags) if article.tags else "[]",
-                        article.article_type,
-                        json.dumps(article.key_points) if article.key_points else "[]",
-                        article.content,
-                        article.slug,
-                        article.cover_image,
-                    ),
-                )
+            with self.write() as conn:
+                cursor = conn.execute(_SQL_INSERT_ARTICLE, self._article_insert_params(article))
                 article.id = cursor.lastrowid
+                self._insert_article_children(conn, [article])
                 logger.info(f"Article added successfully: ID={article.id}, slug={article.slug}")
         except sqlite3.IntegrityError as e:
             logger.error(f"Failed to add article (duplicate?): {e}")
             raise
+        finally:
+            self._invalidate_article_cache()
 
         return article
 
+    def add_articles(self, articles: List[Article]) -> List[Article]:
+        """Add several articles in a single transaction.
+
+        Either all articles are stored or, if any insert fails, none are.
+
+        Args:
+            articles: Article objects to add
+
+        Returns:
+            The same articles with assigned IDs
+        """
+        if not articles:
+            return articles
+
+        logger.debug(f"Adding {len(articles)} articles")
+
+        try:
+            with self.write() as conn:
+                conn.executemany(_SQL_INSERT_ARTICLE, [self._article_insert_params(a) for a in articles])
+                # The write lock is held for the whole batch, so the new IDs
+                # are consecutive and end at the last inserted row
+                last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+                first_id = last_id - len(articles) + 1
+                for offset, article in enumerate(articles):
+                    article.id = first_id + offset
+                self._insert_article_children(conn, articles)
+        except sqlite3.IntegrityError as e:
+            logger.error(f"Failed to add articles (duplicate?): {e}")
+            raise
+        finally:
+            self._invalidate_article_cache()
+
+        logger.info(f"Added {len(articles)} articles: IDs {first_id}-{last_id}")
+
+        return articles
+
     def get_articles(self) -> List[Article]:
         """Get all articles.
 
         Returns:
             List of all Article objects
         """
-        with self.get_connection() as conn:
-            rows = conn.execute("SELECT * FROM articles ORDER BY added_date DESC").fetchall()
-            return [Article.from_row(tuple(row)) for row in rows]
+        return list(self.iter_articles())
+
+    def _get_article_cached(self, column: str, value, sql: str) -> Optional[Article]:
+        """Look up one article, answering repeat lookups from memory.
+
+        The cache is cleared on every article write. A lookup that raced
+        with a write is returned but not cached.
+
+        Args:
+            column: Lookup column ('id', 'url' or 'slug'), part of the cache key
+            value: Value to look up
+            sql: SELECT statement taking the value as its only parameter
+
+        Returns:
+            Copy of the Article (safe to modify) or None if not found
+        """
+        key = (column, value)
+        with self._cache_lock:
+            if key in self._article_cache:
+                self._article_cache.move_to_end(key)
+                return _copy_article(self._article_cache[key])
+            generation = self._cache_generation
+
+        with self.read() as conn:
+            row = conn.execute(sql, (value,)).fetchone()
+            article = self._load_articles(conn, [row])[0] if row else None
+
+        with self._cache_lock:
+            if generation == self._cache_generation:
+                self._article_cache[key] = article
+                if len(self._article_cache) > _ARTICLE_CACHE_SIZE:
+                    self._article_cache.popitem(last=False)
+
+        return _copy_article(article)
+
+    def _invalidate_article_cache(self):
+        """Forget cached lookups after an article write."""
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._article_cache.clear()
 
     def get_article_by_id(self, article_id: int) -> Optional[Article]:
         """Get article by ID.
@@ -152,11 +488,7 @@ class Database:
         Returns:
             Article object or None if not found
         """
-        with self.get_connection() as conn:
-            row = conn.execute("SELECT * FROM articles WHERE id = ?", (article_id,)).fetchone()
-            if row:
-                return Article.from_row(tuple(row))
-        return None
+        return self._get_article_cached("id", article_id, _SQL_GET_ARTICLE_BY_ID)
 
     def get_article_by_url(self, url: str) -> Optional[Article]:
         """Get article by URL.
@@ -167,11 +499,7 @@ class Database:
         Returns:
             Article object or None if not found
         """
-        with self.get_connection() as conn:
-            row = conn.execute("SELECT * FROM articles WHERE url = ?", (url,)).fetchone()
-            if row:
-                return Article.from_row(tuple(row))
-        return None
+        return self._get_article_cached("url", url, _SQL_GET_ARTICLE_BY_URL)
 
     def get_article_by_slug(self, slug: str) -> Optional[Article]:
         """Get article by slug.
@@ -182,31 +510,52 @@ class Database:
         Returns:
             Article object or None if not found
         """
-        with self.get_connection() as conn:
-            row = conn.execute("SELECT * FROM articles WHERE slug = ?", (slug,)).fetchone()
-            if row:
-                return Article.from_row(tuple(row))
-        return None
+        return self._get_article_cached("slug", slug, _SQL_GET_ARTICLE_BY_SLUG)
 
-    def list_articles(
-        self, tag: Optional[str] = None, article_type: Optional[str] = None, limit: Optional[int] = None
-    ) -> List[Article]:
-        """List articles with optional filters.
+    def get_articles_by_slugs(self, slugs: List[str]) -> List[Article]:
+        """Get several articles by slug with one query per batch of slugs.
 
         Args:
-            tag: Filter by tag
-            article_type: Filter by article type ('technical' or 'news')
-            limit: Maximum number of articles to return
+            slugs: Article slugs
 
         Returns:
-            List of Article objects
+            List of matching Article objects (in no particular order)
         """
-        query = "SELECT * FROM articles WHERE 1=1"
+        # An issue can link the same article more than once
+        unique_slugs = list(dict.fromkeys(slugs))
+        rows = []
+
+        with self.read() as conn:
+            for start in range(0, len(unique_slugs), _MAX_IN_PARAMS):
+                chunk = unique_slugs[start:start + _MAX_IN_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(
+                    conn.execute(f"SELECT {_ARTICLE_COLUMNS} FROM articles WHERE slug IN ({placeholders})", chunk)
+                )
+            return self._load_articles(conn, rows)
+
+    @staticmethod
+    def _list_query(
+        select: str, tag: Optional[str], article_type: Optional[str], limit: Optional[int]
+    ) -> Tuple[str, list]:
+        """Add listing filters, ordering and limit to an article SELECT.
+
+        Args:
+            select: SELECT statement ending in a WHERE clause
+            tag: Filter by tag (exact match)
+            article_type: Filter by article type
+            limit: Maximum number of rows
+
+        Returns:
+            Tuple of (query, params)
+        """
+        query = select
         params = []
 
         if tag:
-            query += " AND tags LIKE ?"
-            params.append(f"%{tag}%")
+            # Index seek on article_tags(tag) instead of scanning the JSON column
+            query += " AND id IN (SELECT article_id FROM article_tags WHERE tag = ?)"
+            params.append(tag)
 
         if article_type:
             query += " AND article_type = ?"
@@ -218,9 +567,72 @@ class Database:
             query += " LIMIT ?"
             params.append(limit)
 
-        with self.get_connection() as conn:
-            rows = conn.execute(query, params).fetchall()
-            return [Article.from_row(tuple(row)) for row in rows]
+        return query, params
+
+    def iter_articles(
+        self, tag: Optional[str] = None, article_type: Optional[str] = None, limit: Optional[int] = None
+    ) -> Iterator[Article]:
+        """Iterate over articles with optional filters, newest first.
+
+        Rows are read and turned into articles in small batches, so only one
+        batch is held in memory at a time. A read connection stays checked
+        out until the iterator is exhausted or closed.
+
+        Args:
+            tag: Filter by tag (exact match)
+            article_type: Filter by article type ('technical' or 'news')
+            limit: Maximum number of articles to return
+
+        Yields:
+            Article objects
+        """
+        query, params = self._list_query(_SQL_LIST_ARTICLES, tag, article_type, limit)
+
+        with self.read() as conn:
+            cursor = conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(_ITER_BATCH_SIZE)
+                if not rows:
+                    break
+                yield from self._load_articles(conn, rows)
+
+    def list_articles(
+        self, tag: Optional[str] = None, article_type: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[Article]:
+        """List articles with optional filters.
+
+        Args:
+            tag: Filter by tag (exact match)
+            article_type: Filter by article type ('technical' or 'news')
+            limit: Maximum number of articles to return
+
+        Returns:
+            List of Article objects
+        """
+        return list(self.iter_articles(tag=tag, article_type=article_type, limit=limit))
+
+    def list_articles_summary(
+        self, tag: Optional[str] = None, article_type: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[ArticleSummary]:
+        """List article summaries with optional filters.
+
+        Same filters as list_articles, but content, summary and key points
+        are never read, which keeps listings cheap on large articles.
+
+        Args:
+            tag: Filter by tag (exact match)
+            article_type: Filter by article type ('technical' or 'news')
+            limit: Maximum number of articles to return
+
+        Returns:
+            List of ArticleSummary objects
+        """
+        query, params = self._list_query(_SQL_LIST_ARTICLE_SUMMARIES, tag, article_type, limit)
+
+        with self.read() as conn:
+            summaries = [ArticleSummary.from_row(row) for row in conn.execute(query, params)]
+            self._attach_children(conn, summaries, key_points=False)
+            return summaries
 
     def update_article(self, article: Article) -> bool:
         """Update an existing article.
@@ -231,33 +643,34 @@ class Database:
         Returns:
             True if updated, False if not found
         """
-        import json
+        try:
+            with self.write() as conn:
+                cursor = conn.execute(
+                    _SQL_UPDATE_ARTICLE,
+                    (
+                        article.title,
+                        article.author,
+                        article.source,
+                        article.publish_date,
+                        article.summary,
+                        json.dumps(article.tags) if article.tags else "[]",
+                        article.article_type,
+                        json.dumps(article.key_points) if article.key_points else "[]",
+                        article.content,
+                        article.slug,
+                        article.cover_image,
+                        article.id,
+                    ),
+                )
+                if cursor.rowcount == 0:
+                    return False
 
-        with self.get_connection() as conn:
-            cursor = conn.execute(
-                """
-                UPDATE articles SET
-                    title = ?, author = ?, source = ?, publish_date = ?,
-                    summary = ?, tags = ?, article_type = ?, key_points = ?,
-                    content = ?, slug = ?, cover_image = ?
-                WHERE id = ?
-                """,
-                (
-                    article.title,
-                    article.author,
-                    article.source,
-                    article.publish_date,
-                    article.summary,
-                    json.dumps(article.tags) if article.tags else "[]",
-                    article.article_type,
-                    json.dumps(article.key_points) if article.key_points else "[]",
-                    article.content,
-                    article.slug,
-                    article.cover_image,
-                    article.id,
-                ),
-            )
-            return cursor.rowcount > 0
+                conn.execute(_SQL_DELETE_TAGS, (article.id,))
+                conn.execute(_SQL_DELETE_KEY_POINTS, (article.id,))
+                self._insert_article_children(conn, [article])
+                return True
+        finally:
+            self._invalidate_article_cache()
 
     def delete_article(self, article_id: int) -> bool:
         """Delete an article.
@@ -268,9 +681,12 @@ class Database:
         Returns:
             True if deleted, False if not found
         """
-        with self.get_connection() as conn:
-            cursor = conn.execute("DELETE FROM articles WHERE id = ?", (article_id,))
-            return cursor.rowcount > 0
+        try:
+            with self.write() as conn:
+                cursor = conn.execute(_SQL_DELETE_ARTICLE, (article_id,))
+                return cursor.rowcount > 0
+        finally:
+            self._invalidate_article_cache()
 
     # Issue operations
 
@@ -283,7 +699,7 @@ class Database:
         Returns:
             Issue with assigned ID
         """
-        with self.get_connection() as conn:
+        with self.write() as conn:
             cursor = conn.execute(
                 """
                 INSERT INTO issues (slug, issue_type, start_date, end_date, content, created_at)
@@ -310,10 +726,10 @@ class Database:
         Returns:
             Issue object or None if not found
         """
-        with self.get_connection() as conn:
+        with self.read() as conn:
             row = conn.execute("SELECT * FROM issues WHERE slug = ?", (slug,)).fetchone()
             if row:
-                return Issue.from_row(tuple(row))
+                return Issue.from_row(row)
         return None
 
     def list_issues(self, issue_type: Optional[str] = None, limit: Optional[int] = None) -> List[Issue]:
@@ -339,9 +755,9 @@ class Database:
             query += " LIMIT ?"
             params.append(limit)
 
-        with self.get_connection() as conn:
+        with self.read() as conn:
             rows = conn.execute(query, params).fetchall()
-            return [Issue.from_row(tuple(row)) for row in rows]
+            return [Issue.from_row(row) for row in rows]
 
     def update_issue(self, issue: Issue) -> bool:
         """Update an existing issue.
@@ -352,7 +768,7 @@ class Database:
         Returns:
             True if updated, False if not found
         """
-        with self.get_connection() as conn:
+        with self.write() as conn:
             cursor = conn.execute(
                 """
                 UPDATE issues SET
@@ -362,3 +778,28 @@ class Database:
                 (issue.issue_type, issue.start_date, issue.end_date, issue.content, issue.id),
             )
             return cursor.rowcount > 0
+
+
+_db: Optional[Database] = None
+
+
+def get_db() -> Database:
+    """Get the shared database for the configured database path.
+
+    The schema check in Database.__init__ runs once per process instead of
+    once per command.
+
+    Returns:
+        Database instance
+    """
+    global _db
+    if _db is None:
+        from autopaper.config import get_config
+
+        config = get_config()
+        _db = Database(
+            config.get_database_path(),
+            pool_size=int(config.get("performance.connection_pool_size", 4)),
+        )
+        atexit.register(_db.close)
+    return _db
@@ -52,6 +52,7 @@ app.command()(export.export_pdf)
 app.command()(sync.sync)
 app.command()(cover.generate_cover)
 app.command()(card.generate_card)
+app.command()(card.generate_cards)
 app.command()(email.send_email)
 
 
@@ -4,6 +4,10 @@ from datetime import datetime
 from typing import List, Optional
 import json
 
+# Field markers used in generated issue markdown (Chinese and English templates)
+TAGS_PREFIXES = ("**标签**:", "**Tags**:")
+URL_PREFIXES = ("**原文链接**:", "**Original URL**:")
+
 
 @dataclass
 class Article:
@@ -128,6 +132,52 @@ class Article:
         )
 
 
+@dataclass
+class ArticleSummary:
+    """Article fields needed for listings (without content, summary or key points)."""
+
+    id: Optional[int] = None
+    url: str = ""
+    title: str = ""
+    author: str = ""
+    source: str = ""
+    publish_date: str = ""
+    added_date: Optional[datetime] = None
+    article_type: str = ""
+    slug: str = ""
+    cover_image: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "ArticleSummary":
+        """Create article summary from database row."""
+        (
+            article_id,
+            url,
+            title,
+            author,
+            source,
+            publish_date,
+            added_date,
+            article_type,
+            slug,
+            cover_image,
+        ) = row
+
+        return cls(
+            id=article_id,
+            url=url,
+            title=title or "",
+            author=author or "",
+            source=source or "",
+            publish_date=publish_date or "",
+            added_date=datetime.fromisoformat(added_date) if added_date else None,
+            article_type=article_type or "",
+            slug=slug or "",
+            cover_image=cover_image,
+        )
+
+
 @dataclass
 class Issue:
     """Issue model representing a generated newspaper issue."""
@@ -13,7 +13,7 @@ from jinja2 import Template
 from rich.console import Console
 
 from autopaper.config import Config
-from autopaper.models import Issue
+from autopaper.models import TAGS_PREFIXES, URL_PREFIXES, Issue
 
 console = Console()
 
@@ -163,12 +163,12 @@ class EmailPublisher:
                 msg.attach(pdf_part)
             console.print(f"  [dim]Attached PDF:[/dim] {Path(pdf_path).name}")
 
-        # Attach Markdown if provided
+        # Attach Markdown if provided (the file holds the markdown already loaded
+        # for the body, so it is not read again)
         if md_path:
-            with open(md_path, "rb") as f:
-                md_part = MIMEText(f.read().decode("utf-8"), "markdown", "utf-8")
-                md_part.add_header("Content-Disposition", "attachment", filename=Path(md_path).name)
-                msg.attach(md_part)
+            md_part = MIMEText(issue_markdown, "markdown", "utf-8")
+            md_part.add_header("Content-Disposition", "attachment", filename=Path(md_path).name)
+            msg.attach(md_part)
             console.print(f"  [dim]Attached Markdown:[/dim] {Path(md_path).name}")
 
         return msg
@@ -490,13 +490,13 @@ class EmailPublisher:
                 }
                 current_content = []
 
-            elif line.startswith("**标签**:") or line.startswith("**Tags**:"):
+            elif line.startswith(TAGS_PREFIXES):
                 tags_line = line.split(":", 1)[1].strip()
                 tags = [t.strip() for t in tags_line.split(",")]
                 if current_block:
                     current_block["tags"] = tags
 
-            elif line.startswith("**原文链接**:") or line.startswith("**Original URL**:"):
+            elif line.startswith(URL_PREFIXES):
                 url_line = line.split(":", 1)[1].strip()
                 if "](" in url_line:
                     url_start = url_line.find("](") + 2
@@ -563,25 +563,20 @@ class EmailPublisher:
         console.print(f"[cyan]Connecting to SMTP server:[/cyan] {host}:{port}")
 
         try:
-            # Create SMTP session
-            if port == 465:
-                # SSL connection
-                server = smtplib.SMTP_SSL(host, port, timeout=30)
-            else:
-                # TLS connection
-                server = smtplib.SMTP(host, port, timeout=30)
-                server.starttls()
-
-            # Login
-            console.print("[cyan]Authenticating...[/cyan]")
-            server.login(username, password)
-
-            # Send email
-            console.print(f"[cyan]Sending email to {len(recipients)} recipient(s)...[/cyan]")
-            server.send_message(msg)
-
-            # Quit
-            server.quit()
+            # Create SMTP session (SSL on port 465, STARTTLS otherwise); the
+            # session is closed on exit even if login or sending fails
+            smtp_class = smtplib.SMTP_SSL if port == 465 else smtplib.SMTP
+            with smtp_class(host, port, timeout=30) as server:
+                if port != 465:
+                    server.starttls()
+
+                # Login
+                console.print("[cyan]Authenticating...[/cyan]")
+                server.login(username, password)
+
+                # Send one message to all recipients in a single transaction
+                console.print(f"[cyan]Sending email to {len(recipients)} recipient(s)...[/cyan]")
+                server.send_message(msg, to_addrs=recipients)
 
         except smtplib.SMTPAuthenticationError:
             raise Exception("SMTP authentication failed. Please check your username and password.")
@@ -81,7 +81,8 @@ class PDFPublisher:
 
         try:
             # Create HTML document
-            html_doc = HTML(string=html_content, base_url=".")
+            # Encoding is given explicitly so WeasyPrint never falls back to charset detection
+            html_doc = HTML(string=html_content, base_url=".", encoding="utf-8")
 
             # CSS for PDF
             css_styles = """
@@ -96,7 +97,7 @@ class PDFPublisher:
             # Add custom CSS if provided
             stylesheets = [css]
             if self.css_path:
-                stylesheets.append(CSS(filename=self.css_path))
+                stylesheets.append(CSS(filename=self.css_path, encoding="utf-8"))
 
             # Write PDF
             html_doc.write_pdf(output_path, stylesheets=stylesheets)
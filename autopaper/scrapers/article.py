@@ -233,6 +233,23 @@ class ArticleScraper:
 
         return filepath
 
+    def load_raw(self, url: str) -> Optional[str]:
+        """Load raw HTML from file.
+
+        Args:
+            url: Article URL
+
+        Returns:
+            HTML content or None if not found
+        """
+        filename = self._url_to_filename(url, "html")
+        filepath = self.raw_dir / filename
+
+        if filepath.exists():
+            with open(filepath, "r", encoding="utf-8") as f:
+                return f.read()
+        return None
+
     def save_parsed(self, url: str, parsed_data: Dict) -> Path:
         """Save parsed content to JSON file.
 
@@ -277,7 +294,8 @@ class ArticleScraper:
             force: Force re-scrape even if cached content exists
 
         Returns:
-            Dictionary with url, title, content, short_excerpt, scraped_at
+            Dictionary with url, title, content, short_excerpt, scraped_at, plus the
+            raw ``html`` (not persisted in the parsed JSON; None if no raw copy is cached)
         """
         console.print(f"[cyan]Fetching article from {url}...[/cyan]")
 
@@ -286,6 +304,7 @@ class ArticleScraper:
             cached = self.load_parsed(url)
             if cached:
                 console.print(f"[green]Using cached content for {url}[/green]")
+                cached["html"] = self.load_raw(url)
                 return cached
 
         # Fetch HTML
@@ -312,7 +331,8 @@ class ArticleScraper:
 
         console.print(f"[green]Successfully scraped: {extracted['title'][:60]}...[/green]")
 
-        return result
+        # Hand the HTML back so callers (e.g. cover image extraction) don't fetch it again
+        return {**result, "html": html}
 
     def _url_to_filename(self, url: str, extension: str) -> str:
         """Convert URL to safe filename.
@@ -1,8 +1,9 @@
 """Performance profiling utilities."""
 import functools
+import os
 import time
 import logging
-from typing import Callable, Any
+from typing import Callable, Any, Optional
 
 from autopaper.utils.logging import get_logger
 
@@ -78,14 +79,16 @@ _profiler = ProfilerStats()
 def profile(
     log_slow_calls: float = 5.0,
     log_all_calls: bool = False,
-    enabled: bool = True
+    enabled: Optional[bool] = None
 ) -> Callable:
     """Decorator for profiling function execution time.
 
     Args:
         log_slow_calls: Log warning if function takes longer than this (seconds)
         log_all_calls: Log info for every call
-        enabled: Enable profiling (can be disabled for production)
+        enabled: Enable profiling. Defaults to the ``AUTOPAPER_PROFILE``
+            environment variable (``1`` to enable); when disabled the function
+            is returned undecorated
 
     Returns:
         Decorated function with profiling
@@ -101,12 +104,15 @@ def profile(
         >>>     # Log every call
         >>>     pass
     """
+    if enabled is None:
+        enabled = os.getenv("AUTOPAPER_PROFILE") == "1"
+
     def decorator(func: Callable) -> Callable:
+        if not enabled:
+            return func
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            if not enabled:
-                return func(*args, **kwargs)
-
             start = time.time()
             try:
                 result = func(*args, **kwargs)
@@ -0,0 +1,37 @@
+"""Jinja2 template loading utilities."""
+from functools import lru_cache
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+# Bundled templates directory
+TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
+
+
+@lru_cache(maxsize=1)
+def _get_environment() -> Environment:
+    """Get the shared template environment.
+
+    Compiled templates are kept in memory for the life of the process and
+    their bytecode is cached on disk, so later runs skip compilation.
+
+    Returns:
+        Jinja2 environment for the bundled templates
+    """
+    return Environment(
+        loader=FileSystemLoader(str(TEMPLATES_DIR)),
+        bytecode_cache=FileSystemBytecodeCache(),
+        autoescape=False,
+    )
+
+
+def get_template(name: str) -> Template:
+    """Load a bundled template by file name.
+
+    Args:
+        name: Template file name (e.g., "issue.html.j2")
+
+    Returns:
+        Compiled Jinja2 template
+    """
+    return _get_environment().get_template(name)
@@ -0,0 +1,55 @@
+"""Cached YAML file loading."""
+import os
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple, Union
+
+# Parsed files keyed by (resolved path, mtime_ns, size)
+_YAML_CACHE: Dict[Tuple[str, int, int], Mapping[str, Any]] = {}
+
+
+def _freeze(value: Any) -> Any:
+    """Make a parsed YAML value read-only (dicts become mappingproxies, lists tuples).
+
+    Args:
+        value: Parsed YAML value
+
+    Returns:
+        Read-only equivalent of value
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def load_yaml_file(path: Union[str, os.PathLike]) -> Mapping[str, Any]:
+    """Load a YAML file, reusing the parsed document while the file is unchanged.
+
+    The document is shared between callers, so it is returned as a read-only
+    mapping (nested lists become tuples).
+
+    Args:
+        path: Path to YAML file
+
+    Returns:
+        Parsed document ({} for an empty file)
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    path = os.path.realpath(path)
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+
+    data = _YAML_CACHE.get(key)
+    if data is None:
+        # Imported on first parse; CSafeLoader only exists when PyYAML has libyaml
+        import yaml
+
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        # Pass raw bytes: the parser detects the encoding itself, so the file
+        # skips Python's text decoding layer
+        with open(path, "rb") as f:
+            data = _YAML_CACHE[key] = _freeze(yaml.load(f.read(), Loader=loader) or {})
+    return data
@@ -1,9 +1,13 @@
 """Tests for AutoPaper commands."""
 import os
+import sqlite3
 import tempfile
 import unittest
+from datetime import datetime, timedelta
 from pathlib import Path
+from unittest import mock
 
+from autopaper.config import Config
 from autopaper.database import Database
 from autopaper.models import Article, Issue
 
@@ -22,6 +26,7 @@ class TestCommands(unittest.TestCase):
         """Clean up test fixtures."""
         import shutil
 
+        self.db.close()
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def test_add_article(self):
@@ -41,6 +46,28 @@ class TestCommands(unittest.TestCase):
         self.assertEqual(saved.url, "https://example.com/test")
         self.assertEqual(saved.title, "Test Article")
 
+    def test_add_articles(self):
+        """Test adding several articles in one batch."""
+        first = self.db.add_article(Article(url="https://example.com/first", title="First", slug="first"))
+        articles = [
+            Article(url=f"https://example.com/batch{i}", title=f"Batch {i}", slug=f"batch-{i}", tags=["batch"])
+            for i in range(3)
+        ]
+
+        saved = self.db.add_articles(articles)
+
+        self.assertEqual([a.id for a in saved], [first.id + 1, first.id + 2, first.id + 3])
+        for article in saved:
+            self.assertEqual(self.db.get_article_by_id(article.id).slug, article.slug)
+
+        # A duplicate URL rolls back the whole batch
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.db.add_articles([
+                Article(url="https://example.com/new", title="New", slug="new"),
+                Article(url="https://example.com/first", title="Dup", slug="dup"),
+            ])
+        self.assertIsNone(self.db.get_article_by_url("https://example.com/new"))
+
     def test_get_article_by_url(self):
         """Test retrieving article by URL."""
         article = Article(
@@ -100,6 +127,80 @@ class TestCommands(unittest.TestCase):
         self.assertEqual(technical_articles[0].article_type, "technical")
         self.assertEqual(news_articles[0].article_type, "news")
 
+    def test_list_articles_by_tag_and_type_with_limit(self):
+        """Test combining tag, type and limit filters."""
+        for i in range(4):
+            article = Article(
+                url=f"https://example.com/test{i}",
+                title=f"Test Article {i}",
+                slug=f"test-article-{i}",
+                tags=["rust"] if i % 2 == 0 else ["python"],
+                article_type="technical" if i < 3 else "news",
+            )
+            self.db.add_article(article)
+
+        articles = self.db.list_articles(tag="rust", article_type="technical")
+        limited = self.db.list_articles(tag="rust", article_type="technical", limit=1)
+
+        self.assertEqual({a.slug for a in articles}, {"test-article-0", "test-article-2"})
+        self.assertEqual(len(limited), 1)
+
+    def test_iter_articles_across_batches(self):
+        """Test that iterating yields every article with its tags, newest first."""
+        self.db.add_articles([
+            Article(
+                url=f"https://example.com/test{i}",
+                slug=f"test-article-{i}",
+                tags=[f"tag{i}"],
+                added_date=datetime(2026, 1, 1) + timedelta(minutes=i),
+            )
+            for i in range(250)
+        ])
+
+        articles = list(self.db.iter_articles())
+
+        self.assertEqual(len(articles), 250)
+        self.assertEqual(articles[0].slug, "test-article-249")
+        self.assertEqual(articles[-1].tags, ["tag0"])
+
+    def test_list_articles_summary(self):
+        """Test listing summaries with the same filters as full articles."""
+        for i in range(3):
+            article = Article(
+                url=f"https://example.com/test{i}",
+                title=f"Test Article {i}",
+                slug=f"test-article-{i}",
+                tags=["rust"] if i != 1 else ["python"],
+                article_type="technical",
+                content="Long content",
+            )
+            self.db.add_article(article)
+
+        summaries = self.db.list_articles_summary(tag="rust")
+
+        self.assertEqual({s.slug for s in summaries}, {"test-article-0", "test-article-2"})
+        self.assertEqual(summaries[0].tags, ["rust"])
+        self.assertFalse(hasattr(summaries[0], "content"))
+
+    def test_get_articles_by_slugs(self):
+        """Test retrieving several articles by slug."""
+        for i in range(3):
+            article = Article(
+                url=f"https://example.com/test{i}",
+                title=f"Test Article {i}",
+                slug=f"test-article-{i}",
+            )
+            self.db.add_article(article)
+
+        articles = self.db.get_articles_by_slugs(["test-article-2", "test-article-0", "missing"])
+
+        self.assertEqual({a.slug for a in articles}, {"test-article-0", "test-article-2"})
+        self.assertEqual(self.db.get_articles_by_slugs([]), [])
+
+        # Duplicates are returned once, and long slug lists are split into batches
+        many = ["test-article-1", "test-article-1"] + [f"missing-{i}" for i in range(1200)]
+        self.assertEqual([a.slug for a in self.db.get_articles_by_slugs(many)], ["test-article-1"])
+
     def test_add_issue(self):
         """Test adding an issue to database."""
         issue = Issue(
@@ -130,6 +231,113 @@ class TestCommands(unittest.TestCase):
         self.assertIsNotNone(retrieved)
         self.assertEqual(retrieved.issue_type, "tech")
 
+    def test_adds_cover_image_column_to_old_database(self):
+        """Test that opening a database without cover_image adds the column."""
+        old_db_path = os.path.join(self.temp_dir, "old.db")
+        conn = sqlite3.connect(old_db_path)
+        conn.execute(
+            "CREATE TABLE articles (id INTEGER PRIMARY KEY AUTOINCREMENT, url TEXT UNIQUE NOT NULL, "
+            "title TEXT, author TEXT, source TEXT, publish_date TEXT, added_date TIMESTAMP, "
+            "summary TEXT, tags TEXT, article_type TEXT, key_points TEXT, content TEXT, slug TEXT)"
+        )
+        conn.commit()
+        conn.close()
+
+        db = Database(old_db_path)
+        self.addCleanup(db.close)
+        db.add_article(Article(url="https://example.com/old", title="Old", cover_image="old.jpg"))
+
+        retrieved = db.get_article_by_url("https://example.com/old")
+
+        self.assertEqual(retrieved.cover_image, "old.jpg")
+
+    def test_cached_lookups_follow_writes(self):
+        """Test that repeat lookups see updates, deletes and new articles."""
+        self.assertIsNone(self.db.get_article_by_slug("test"))
+        article = self.db.add_article(Article(url="https://example.com/test", title="Old", slug="test"))
+
+        first = self.db.get_article_by_slug("test")
+        first.tags.append("changed locally")
+        self.assertEqual(self.db.get_article_by_slug("test").tags, [])
+
+        article.title = "New"
+        self.db.update_article(article)
+        self.assertEqual(self.db.get_article_by_slug("test").title, "New")
+
+        self.db.delete_article(article.id)
+        self.assertIsNone(self.db.get_article_by_id(article.id))
+
+    def test_tags_and_key_points_round_trip(self):
+        """Test that tags and key points keep their order across add and update."""
+        article = self.db.add_article(
+            Article(url="https://example.com/test", slug="test", tags=["b", "a"], key_points=["one", "two"])
+        )
+
+        retrieved = self.db.get_article_by_slug("test")
+        self.assertEqual(retrieved.tags, ["b", "a"])
+        self.assertEqual(retrieved.key_points, ["one", "two"])
+
+        article.tags = ["c"]
+        article.key_points = ["three", "four", "five"]
+        self.db.update_article(article)
+
+        retrieved = self.db.get_article_by_id(article.id)
+        self.assertEqual(retrieved.tags, ["c"])
+        self.assertEqual(retrieved.key_points, ["three", "four", "five"])
+
+    def test_moves_json_tags_of_old_database_to_tag_table(self):
+        """Test that tags stored only as JSON are copied into article_tags."""
+        old_db_path = os.path.join(self.temp_dir, "old.db")
+        conn = sqlite3.connect(old_db_path)
+        conn.execute(
+            "CREATE TABLE articles (id INTEGER PRIMARY KEY AUTOINCREMENT, url TEXT UNIQUE NOT NULL, "
+            "title TEXT, author TEXT, source TEXT, publish_date TEXT, added_date TIMESTAMP, "
+            "summary TEXT, tags TEXT, article_type TEXT, key_points TEXT, content TEXT, slug TEXT, cover_image TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO articles (url, slug, tags, key_points) VALUES (?, ?, ?, ?)",
+            ("https://example.com/old", "old", '["rust", "async"]', '["first", "second"]'),
+        )
+        conn.execute("INSERT INTO articles (url, slug, tags) VALUES (?, ?, ?)", ("https://example.com/bad", "bad", ""))
+        conn.commit()
+        conn.close()
+
+        db = Database(old_db_path)
+        retrieved = db.get_article_by_slug("old")
+        db.close()
+
+        self.assertEqual(retrieved.tags, ["rust", "async"])
+        self.assertEqual(retrieved.key_points, ["first", "second"])
+
+
+class TestConfig(unittest.TestCase):
+    """Test cases for configuration loading."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.temp_dir, "config.yaml")
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_unset_env_reference_keeps_getter_defaults(self):
+        """Test that an unset ${VAR} in the YAML does not override getter defaults."""
+        with open(self.config_path, "w") as f:
+            f.write("email:\n  smtp_host: ${SMTP_HOST}\n  smtp_port: ${SMTP_PORT}\n")
+
+        with mock.patch.dict(os.environ):
+            os.environ.pop("SMTP_HOST", None)
+            os.environ.pop("SMTP_PORT", None)
+            config = Config(self.config_path)
+
+            self.assertIsNone(config.get("email.smtp_port"))
+            self.assertEqual(config.get_smtp_port(), 587)
+            self.assertEqual(config.get_smtp_host(), "")
+
 
 if __name__ == "__main__":
     unittest.main()
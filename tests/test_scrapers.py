@@ -78,6 +78,16 @@ class TestArticleScraper(unittest.TestCase):
         self.assertEqual(loaded["url"], url)
         self.assertEqual(loaded["title"], "Test Article")
 
+    def test_save_and_load_raw(self):
+        """Test saving and loading raw HTML."""
+        url = "https://example.com/test"
+        html = "<html><body>Test</body></html>"
+
+        self.assertIsNone(self.scraper.load_raw(url))
+
+        self.scraper.save_raw(url, html)
+        self.assertEqual(self.scraper.load_raw(url), html)
+
 
 if __name__ == "__main__":
     unittest.main()